@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Headless batch entry point for the Computer Vision Playground filter engines.
+
+Applies the same filters the control panel exposes (Mean, Gaussian, Custom, Median with
+constant, sigma, normalize, filter type and border mode) to one image or to every image
+in a directory, writes the results and a timing summary, and never imports PySide6.
+
+Example:
+    python src/cli.py scans/ out/ --filter Gaussian --kernel-size 3 --sigma 1.5
+"""
+
+import sys
+import os
+import json
+import time
+import argparse
+import numpy as np
+from consts import (
+    DEFAULT_KERNEL_SIZE, MIN_KERNEL_SIZE,
+    DEFAULT_CONSTANT_MULTIPLIER,
+    DEFAULT_FILTER_TYPE, FILTER_TYPES,
+    DEFAULT_FILTER_SELECTION, FILTER_SELECTIONS_LINEAR, FILTER_SELECTIONS_NONLINEAR,
+    DEFAULT_BORDER_MODE, BORDER_MODES,
+    DEFAULT_OUTPUT_SHAPE, OUTPUT_SHAPES,
+    DEFAULT_SIGMA
+)
+from utils.kernel_utils import gaussian_kernel
+from utils.streaming import open_image, stream_filter
+
+# Files read through memory maps and written as .npy
+ARRAY_EXTENSIONS = {".npy", ".raw"}
+# Files decoded with OpenCV and written back in the same format
+IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg", ".bmp", ".tiff", ".tif"}
+
+SUMMARY_FILE_NAME = "timing_summary.json"
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Apply a playground filter to images without starting the GUI.")
+    parser.add_argument("input", help="Image file or directory of images (.npy, .raw, .png, .jpg, .bmp, .tiff)")
+    parser.add_argument("output", help="Directory for the filtered images and the timing summary")
+    parser.add_argument("--filter", default=DEFAULT_FILTER_SELECTION,
+                        choices=FILTER_SELECTIONS_LINEAR + FILTER_SELECTIONS_NONLINEAR)
+    parser.add_argument("--kernel-size", type=int, default=DEFAULT_KERNEL_SIZE,
+                        help="Kernel radius k (the kernel is 2k+1 wide)")
+    parser.add_argument("--kernel", help="Custom kernel weights as .npy or whitespace/comma separated text")
+    parser.add_argument("--constant", type=float, default=DEFAULT_CONSTANT_MULTIPLIER)
+    parser.add_argument("--sigma", type=float, default=DEFAULT_SIGMA)
+    parser.add_argument("--no-normalize", dest="normalize", action="store_false",
+                        help="Do not normalize the Gaussian kernel")
+    parser.add_argument("--filter-type", default=DEFAULT_FILTER_TYPE, choices=FILTER_TYPES)
+    parser.add_argument("--border-mode", default=DEFAULT_BORDER_MODE, choices=BORDER_MODES)
+    parser.add_argument("--output-shape", default=DEFAULT_OUTPUT_SHAPE, choices=OUTPUT_SHAPES)
+    parser.add_argument("--output-dtype", default="uint8", choices=["uint8", "float32", "float64"],
+                        help="uint8 rounds and clamps like the output image; float types keep raw values")
+    parser.add_argument("--raw-shape", type=int, nargs=2, metavar=("ROWS", "COLS"),
+                        help="Shape of headerless .raw inputs")
+    parser.add_argument("--raw-dtype", default="uint8", help="Pixel type of headerless .raw inputs")
+    parser.add_argument("--band-rows", type=int, help="Output rows per band (default: sized from memory budget)")
+    args = parser.parse_args(argv)
+    
+    if args.kernel_size < MIN_KERNEL_SIZE:
+        parser.error(f"--kernel-size must be at least {MIN_KERNEL_SIZE}")
+    if args.band_rows is not None and args.band_rows < 1:
+        parser.error("--band-rows must be at least 1")
+    if args.filter == "Custom" and not args.kernel:
+        parser.error("--kernel is required for the Custom filter")
+    return args
+
+
+def build_kernel(args: argparse.Namespace) -> np.ndarray:
+    """
+    Build the kernel the control panel would produce for the chosen filter.
+    """
+    size = 2 * args.kernel_size + 1
+    if args.filter == "Gaussian":
+        return gaussian_kernel(size, args.sigma, args.normalize)
+    if args.filter == "Custom":
+        if args.kernel.endswith(".npy"):
+            kernel = np.load(args.kernel)
+        else:
+            with open(args.kernel) as kernel_file:
+                kernel = np.loadtxt(kernel_file.read().replace(",", " ").splitlines(), ndmin=2)
+        kernel = np.asarray(kernel, dtype=np.float64)
+        if kernel.ndim != 2 or kernel.shape[0] != kernel.shape[1] or kernel.shape[0] % 2 == 0:
+            raise ValueError(f"Custom kernel must be square with an odd size, got shape {kernel.shape}")
+        return kernel
+    # Mean uses all-ones weights and Median only uses the kernel size
+    return np.ones((size, size))
+
+
+def collect_inputs(path: str) -> list[str]:
+    extensions = ARRAY_EXTENSIONS | IMAGE_EXTENSIONS
+    if os.path.isdir(path):
+        return [
+            os.path.join(path, name) for name in sorted(os.listdir(path))
+            if os.path.splitext(name)[1].lower() in extensions
+        ]
+    return [path]
+
+
+def process_file(input_path: str, output_dir: str, kernel: np.ndarray, args: argparse.Namespace) -> dict:
+    stem, extension = os.path.splitext(os.path.basename(input_path))
+    extension = extension.lower()
+    filter_options = dict(
+        filter_name=args.filter, kernel=kernel, constant=args.constant, filter_type=args.filter_type,
+        border_mode=args.border_mode, output_shape=args.output_shape, band_rows=args.band_rows,
+        output_dtype=np.dtype(args.output_dtype)
+    )
+    
+    start_time = time.perf_counter()
+    if extension in IMAGE_EXTENSIONS:
+        # OpenCV is only needed for encoded images, so .npy/.raw batches do not load it
+        import cv2
+        source = cv2.imread(input_path, cv2.IMREAD_GRAYSCALE)
+        if source is None:
+            raise ValueError("Failed to load image file")
+        # Float results cannot be stored in common image formats
+        output_extension = extension if args.output_dtype == "uint8" else ".npy"
+        output_path = os.path.join(output_dir, f"{stem}_{args.filter.lower()}{output_extension}")
+        if output_extension == ".npy":
+            output = stream_filter(source, output_path, **filter_options)
+        else:
+            output = stream_filter(source, None, **filter_options)
+            if not cv2.imwrite(output_path, output):
+                raise ValueError(f"Failed to write {output_path}")
+    else:
+        source = open_image(input_path, args.raw_shape, np.dtype(args.raw_dtype))
+        output_path = os.path.join(output_dir, f"{stem}_{args.filter.lower()}.npy")
+        output = stream_filter(source, output_path, **filter_options)
+    elapsed = time.perf_counter() - start_time
+    
+    megapixels = source.shape[0] * source.shape[1] / 1e6
+    return {
+        "input": input_path,
+        "output": output_path,
+        "shape": list(source.shape),
+        "output_shape": list(output.shape),
+        "seconds": elapsed,
+        "megapixels_per_second": megapixels / elapsed if elapsed > 0 else None
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Run the configured filter over every input and write outputs plus a timing summary.
+    
+    Returns:
+        Process exit code: 0 if every input was processed, 1 otherwise
+    """
+    args = parse_args(argv)
+    try:
+        kernel = build_kernel(args)
+    except (OSError, ValueError) as e:
+        print(f"Unable to load kernel: {e}", file=sys.stderr)
+        return 1
+    
+    input_paths = collect_inputs(args.input)
+    if not input_paths:
+        print(f"No supported images found in {args.input}", file=sys.stderr)
+        return 1
+    os.makedirs(args.output, exist_ok=True)
+    
+    results = []
+    failures = []
+    total_start = time.perf_counter()
+    for input_path in input_paths:
+        try:
+            result = process_file(input_path, args.output, kernel, args)
+        except Exception as e:
+            failures.append({"input": input_path, "error": str(e)})
+            print(f"FAILED  {input_path}: {e}", file=sys.stderr)
+            continue
+        results.append(result)
+        print(f"{result['seconds']:8.3f}s  {result['shape'][0]}x{result['shape'][1]}  {input_path} -> {result['output']}")
+    total_seconds = time.perf_counter() - total_start
+    
+    summary = {
+        "filter": args.filter,
+        "kernel_size": int(kernel.shape[0]),
+        "constant": args.constant,
+        "sigma": args.sigma if args.filter == "Gaussian" else None,
+        "normalize": args.normalize if args.filter == "Gaussian" else None,
+        "filter_type": args.filter_type,
+        "border_mode": args.border_mode,
+        "output_shape": args.output_shape,
+        "files": results,
+        "failures": failures,
+        "total_seconds": total_seconds
+    }
+    with open(os.path.join(args.output, SUMMARY_FILE_NAME), "w") as summary_file:
+        json.dump(summary, summary_file, indent=2)
+    
+    print(f"Processed {len(results)}/{len(input_paths)} file(s) in {total_seconds:.3f}s")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
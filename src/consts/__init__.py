@@ -9,14 +9,29 @@ from .filter_config import (
     DEFAULT_FILTER_PROFILE, FILTER_PROFILES,
     DEFAULT_FILTER_CATEGORY, FILTER_CATEGORIES,
     DEFAULT_FILTER_TYPE, FILTER_TYPES,
+    DEFAULT_BORDER_MODE, BORDER_MODES,
+    DEFAULT_OUTPUT_SHAPE, OUTPUT_SHAPES,
     DEFAULT_FILTER_SELECTION, FILTER_SELECTIONS_LINEAR, FILTER_SELECTIONS_NONLINEAR,
     DEFAULT_NONLINEAR_FILTER,
-    DEFAULT_INPUT_MODE, INPUT_MODES,
+    DEFAULT_INPUT_MODE, INPUT_MODES, DEFAULT_INCREMENTAL_UPDATES,
     DEFAULT_KERNEL_PRESET, KERNEL_PRESETS,
     DEFAULT_KERNEL_VALUE,
     PROFILE_FILTER_TYPE, PROFILE_FILTER_SELECTION,
     DEFAULT_SIGMA, MIN_SIGMA, MAX_SIGMA, SIGMA_STEP, SIGMA_DECIMALS
 )
+from .engine import (
+    SEPARABLE_TOLERANCE, HISTOGRAM_MEDIAN_MIN_RADIUS, HISTOGRAM_MEDIAN_MIN_RADIUS_FLOAT,
+    FFT_KERNEL_SIZE_THRESHOLD, FFT_MAX_CLAMPED_WEIGHTS,
+    POSITION_CACHE_MAX_ENTRIES, GAUSSIAN_KERNEL_CACHE_SIZE,
+    STREAM_MAX_BAND_BYTES, STREAM_WORKING_COPIES, STREAM_FFT_SCRATCH_COPIES,
+    MEDIAN_CHUNK_BYTES, HISTOGRAM_MEDIAN_BLOCK_COLS,
+    PLAYBACK_LOOKAHEAD_POSITIONS
+)
+from .playback import TURBO_FRAME_RATE, TURBO_FRAME_BUDGET
+from .ocr import (
+    OCR_BATCH_SIZE, OCR_RECOGNITION_ONLY, OCR_ALLOWLIST, OCR_LANGUAGES, OCR_MODEL_DIR_ENV,
+    OCR_CACHE_MAX_BYTES, OCR_CACHE_DIR_ENV, OCR_CACHE_VERSION
+)
 
 __all__ = [
     "DEFAULT_GRID_SIZE", "MIN_GRID_SIZE", "MAX_GRID_SIZE",
@@ -27,11 +42,23 @@ __all__ = [
     "DEFAULT_FILTER_PROFILE", "FILTER_PROFILES",
     "DEFAULT_FILTER_CATEGORY", "FILTER_CATEGORIES",
     "DEFAULT_FILTER_TYPE", "FILTER_TYPES",
+    "DEFAULT_BORDER_MODE", "BORDER_MODES",
+    "DEFAULT_OUTPUT_SHAPE", "OUTPUT_SHAPES",
     "DEFAULT_FILTER_SELECTION", "FILTER_SELECTIONS_LINEAR", "FILTER_SELECTIONS_NONLINEAR",
     "DEFAULT_NONLINEAR_FILTER",
-    "DEFAULT_INPUT_MODE", "INPUT_MODES",
+    "DEFAULT_INPUT_MODE", "INPUT_MODES", "DEFAULT_INCREMENTAL_UPDATES",
     "DEFAULT_KERNEL_PRESET", "KERNEL_PRESETS",
     "DEFAULT_KERNEL_VALUE",
     "PROFILE_FILTER_TYPE", "PROFILE_FILTER_SELECTION",
-    "DEFAULT_SIGMA", "MIN_SIGMA", "MAX_SIGMA", "SIGMA_STEP", "SIGMA_DECIMALS"
+    "DEFAULT_SIGMA", "MIN_SIGMA", "MAX_SIGMA", "SIGMA_STEP", "SIGMA_DECIMALS",
+    "SEPARABLE_TOLERANCE", "HISTOGRAM_MEDIAN_MIN_RADIUS", "HISTOGRAM_MEDIAN_MIN_RADIUS_FLOAT",
+    "FFT_KERNEL_SIZE_THRESHOLD", "FFT_MAX_CLAMPED_WEIGHTS",
+    "POSITION_CACHE_MAX_ENTRIES", "GAUSSIAN_KERNEL_CACHE_SIZE",
+    "STREAM_MAX_BAND_BYTES", "STREAM_WORKING_COPIES", "STREAM_FFT_SCRATCH_COPIES",
+    "MEDIAN_CHUNK_BYTES", "HISTOGRAM_MEDIAN_BLOCK_COLS",
+    "PLAYBACK_LOOKAHEAD_POSITIONS",
+    "TURBO_FRAME_RATE", "TURBO_FRAME_BUDGET",
+    "OCR_BATCH_SIZE", "OCR_RECOGNITION_ONLY", "OCR_ALLOWLIST",
+    "OCR_LANGUAGES", "OCR_MODEL_DIR_ENV",
+    "OCR_CACHE_MAX_BYTES", "OCR_CACHE_DIR_ENV", "OCR_CACHE_VERSION"
 ]
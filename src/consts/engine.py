@@ -0,0 +1,16 @@
+SEPARABLE_TOLERANCE = 1e-9
+# Radius from which histogram_median() beats sorting windows (measured on 1000x1000 and 500x2000
+# grids); sorting float64 windows is slower, so float data holding 8-bit values crosses over earlier
+HISTOGRAM_MEDIAN_MIN_RADIUS = 7
+HISTOGRAM_MEDIAN_MIN_RADIUS_FLOAT = 5
+FFT_KERNEL_SIZE_THRESHOLD = 15
+FFT_MAX_CLAMPED_WEIGHTS = 8
+POSITION_CACHE_MAX_ENTRIES = 4096
+GAUSSIAN_KERNEL_CACHE_SIZE = 256
+STREAM_MAX_BAND_BYTES = 64 * 1024 * 1024
+STREAM_WORKING_COPIES = 6
+# Complex spectra and inverse transform of one fft_correlate() call, in float64s per padded FFT cell
+STREAM_FFT_SCRATCH_COPIES = 5
+MEDIAN_CHUNK_BYTES = 16 * 1024 * 1024
+HISTOGRAM_MEDIAN_BLOCK_COLS = 512
+PLAYBACK_LOOKAHEAD_POSITIONS = 32
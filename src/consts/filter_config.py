@@ -7,6 +7,12 @@ FILTER_CATEGORIES = ["Linear", "Non-Linear"]
 DEFAULT_FILTER_TYPE = "Cross-Correlation"
 FILTER_TYPES = ["Cross-Correlation", "Convolution"]
 
+DEFAULT_BORDER_MODE = "Valid Only"
+BORDER_MODES = ["Valid Only", "Zero", "Replicate", "Reflect", "Wrap"]
+
+DEFAULT_OUTPUT_SHAPE = "same"
+OUTPUT_SHAPES = ["same", "valid", "full"]
+
 DEFAULT_FILTER_SELECTION = "Mean"
 FILTER_SELECTIONS_LINEAR = ["Mean", "Gaussian", "Custom"]
 FILTER_SELECTIONS_NONLINEAR = ["Median"]
@@ -15,6 +21,8 @@ DEFAULT_NONLINEAR_FILTER = "Median"
 DEFAULT_INPUT_MODE = "Toggle"
 INPUT_MODES = ["Toggle", "Custom"]
 
+DEFAULT_INCREMENTAL_UPDATES = True
+
 DEFAULT_KERNEL_PRESET = "None"
 KERNEL_PRESETS = ["None", "Identity"]
 
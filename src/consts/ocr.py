@@ -0,0 +1,10 @@
+OCR_BATCH_SIZE = 64
+OCR_RECOGNITION_ONLY = True
+OCR_ALLOWLIST = "0123456789"
+OCR_LANGUAGES = ["en"]
+OCR_MODEL_DIR_ENV = "CV_PLAYGROUND_OCR_MODEL_DIR"
+# On-disk OCR result cache: total size bound and directory override; bump the version
+# whenever the cached fields or the OCR pipeline change so old entries are no longer hit
+OCR_CACHE_MAX_BYTES = 16 * 1024 * 1024
+OCR_CACHE_DIR_ENV = "CV_PLAYGROUND_OCR_CACHE_DIR"
+OCR_CACHE_VERSION = 1
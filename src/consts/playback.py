@@ -0,0 +1,2 @@
+TURBO_FRAME_RATE = 60
+TURBO_FRAME_BUDGET = 0.5
@@ -1,4 +1,6 @@
 from .image_grid import ImageGridModel
+from .grid_change import GridChange
 from .kernel_application import KernelApplicationCoordinator, ApplicationState
+from .position_cache import PositionResultCache
 
-__all__ = ["ImageGridModel", "KernelApplicationCoordinator", "ApplicationState"]
+__all__ = ["ImageGridModel", "GridChange", "KernelApplicationCoordinator", "ApplicationState", "PositionResultCache"]
@@ -1,5 +1,12 @@
 from abc import ABC, abstractmethod
 from typing import Any
+import numpy as np
+from consts import DEFAULT_OUTPUT_SHAPE
+from utils.filter_engine import (
+    to_float_array, has_full_windows, sliding_windows, bounded_weighted_sum, embed_valid_output,
+    output_extent, border_index, border_indices, gather_with_border, PaddedBuffer
+)
+from .calculation_record import CalculationRecord
 
 
 class BaseFilterCalculator(ABC):
@@ -7,26 +14,36 @@ class BaseFilterCalculator(ABC):
     Base class for filter calculators providing common convolution/cross-correlation logic.
     
     Subclasses must implement _calculate_output() to define how the final result is computed
-    from the weighted sum of input pixels.
+    from the weighted sum of input pixels, and _calculate_full_output() for the vectorized
+    whole-image equivalent used by apply_full().
+    
+    calculate() works on the coordinator's current position, or on any position passed
+    explicitly without moving the kernel (used to compute positions ahead of playback).
+    
+    Taps outside the input are read through the coordinator's border mode. The vectorized
+    paths pad the input once into a reusable buffer, so the window kernels never bounds-check.
     """
     def __init__(self, input_model, kernel_model, coordinator):
         self._input_model = input_model
         self._kernel_model = kernel_model
         self._coordinator = coordinator
+        self._padded_buffer = PaddedBuffer()
+        # Identifies the whole-image input passed to _apply_valid() so subclasses can cache
+        # derived data; None while a cropped region is being computed
+        self._input_key = None
     
-    def calculate(self, constant: float, filter_type: str = "Cross-Correlation") -> dict[str, Any]:
-        affected_cells = self._coordinator.get_affected_cells()
-        output_cell = self._coordinator.get_output_cell()
+    def calculate(self, constant: float, filter_type: str = "Cross-Correlation",
+                  position: tuple[int, int] | None = None) -> dict[str, Any]:
+        affected_cells, output_cell = self._get_window(position)
         
         kernel_size = self._kernel_model.get_grid_size()
         kernel_data = self._kernel_model.get_grid_data()
-        input_data = self._input_model.get_grid_data()
         
         calculations = []
         total_sum = 0.0
         
         for idx, (row, col) in enumerate(affected_cells):
-            input_value = input_data[row][col]
+            input_value = self._get_input_value(row, col)
             
             offset_row, offset_col = self._map_coordinates_to_kernel(row, col, output_cell, kernel_size, filter_type)
             kernel_row, kernel_col = self._offset_to_kernel_indices(offset_row, offset_col, kernel_size)
@@ -36,17 +53,10 @@ class BaseFilterCalculator(ABC):
             result = input_value * final_kernel_value
             bounded_result = max(0, min(255, result))
             
-            calculations.append({
-                'index': idx,
-                'coordinate': (row, col),
-                'input_value': input_value,
-                'kernel_value': kernel_value,
-                'constant': constant,
-                'final_kernel_value': final_kernel_value,
-                'calculation': f"({input_value}×{final_kernel_value:.2f})",
-                'result': result,
-                'bounded_result': bounded_result
-            })
+            calculations.append(CalculationRecord(
+                idx, (row, col), input_value, kernel_value, constant,
+                final_kernel_value, result, bounded_result
+            ))
             
             total_sum += bounded_result
         
@@ -61,6 +71,111 @@ class BaseFilterCalculator(ABC):
             'output_cell': output_cell
         }
     
+    def apply_full(self, constant: float, filter_type: str = "Cross-Correlation",
+                   border_mode: str | None = None, output_shape: str = DEFAULT_OUTPUT_SHAPE) -> np.ndarray:
+        """
+        Compute every output cell in one vectorized pass.
+        
+        Args:
+            constant: Multiplier applied to every kernel weight
+            filter_type: "Cross-Correlation" or "Convolution"
+            border_mode: How taps outside the input are read ("Valid Only", "Zero", "Replicate",
+                "Reflect" or "Wrap"); defaults to the coordinator's border mode
+            output_shape: "same" (N x N), "valid" (N-2k) or "full" (N+2k)
+            
+        Returns:
+            Output grid of the requested shape. With "Valid Only", cells whose window does
+            not fit inside the input are NaN.
+        """
+        if border_mode is None:
+            border_mode = self._coordinator.get_border_mode()
+        input_data = to_float_array(self._input_model.get_array(), self._input_model.get_mask())
+        radius = self._kernel_model.get_grid_size() // 2
+        rows, cols = input_data.shape
+        
+        extent = output_extent(radius, output_shape)
+        shape = (max(0, rows + 2 * extent), max(0, cols + 2 * extent))
+        padding = 0 if border_mode == "Valid Only" else radius + extent
+        padded_input = self._padded_buffer.pad(input_data, padding, border_mode)
+        
+        if not has_full_windows(padded_input, radius):
+            return np.full(shape, np.nan)
+        
+        self._input_key = (self._input_model.get_version(), border_mode, padding)
+        try:
+            valid_output = self._apply_valid(padded_input, constant, filter_type)
+        finally:
+            self._input_key = None
+        return embed_valid_output(valid_output, shape, radius + extent - padding)
+    
+    def apply_region(self, constant: float, filter_type: str,
+                     top: int, left: int, bottom: int, right: int) -> np.ndarray:
+        """
+        Compute only the output cells in the rectangle [top, bottom) x [left, right).
+        
+        The input is cropped to the rectangle plus a k-cell halo, read through the
+        coordinator's border mode, so the cost depends on the size of the rectangle rather
+        than the size of the grid.
+        
+        Args:
+            constant: Multiplier applied to every kernel weight
+            filter_type: "Cross-Correlation" or "Convolution"
+            top, left, bottom, right: Output rectangle (bottom and right exclusive)
+        
+        Returns:
+            Array of shape (bottom - top, right - left). Cells the kernel is never centered on
+            are NaN.
+        """
+        border_mode = self._coordinator.get_border_mode()
+        input_values = self._input_model.get_array()
+        input_mask = self._input_model.get_mask()
+        radius = self._kernel_model.get_grid_size() // 2
+        rows, cols = input_values.shape
+        output = np.full((max(0, bottom - top), max(0, right - left)), np.nan)
+        
+        # Restrict the rectangle to positions the coordinator can visit
+        margin = radius if border_mode == "Valid Only" else 0
+        valid_top, valid_left = max(top, margin), max(left, margin)
+        valid_bottom, valid_right = min(bottom, rows - margin), min(right, cols - margin)
+        if valid_top >= valid_bottom or valid_left >= valid_right:
+            return output
+        
+        row_sources = border_indices(np.arange(valid_top - radius, valid_bottom + radius), rows, border_mode)
+        col_sources = border_indices(np.arange(valid_left - radius, valid_right + radius), cols, border_mode)
+        cropped_input = to_float_array(
+            gather_with_border(input_values, row_sources, col_sources),
+            gather_with_border(input_mask, row_sources, col_sources)
+        )
+        valid_output = self._apply_valid(cropped_input, constant, filter_type)
+        output[valid_top - top:valid_bottom - top, valid_left - left:valid_right - left] = valid_output
+        return output
+    
+    def _apply_valid(self, input_data: np.ndarray, constant: float, filter_type: str) -> np.ndarray:
+        kernel_size = self._kernel_model.get_grid_size()
+        kernel_data = self._kernel_model.get_grid_data()
+        
+        windows = sliding_windows(input_data, kernel_size // 2)
+        total_sums = bounded_weighted_sum(windows, kernel_data, constant)
+        
+        kernel_area = kernel_size * kernel_size
+        return self._calculate_full_output(total_sums, kernel_area)
+    
+    def _get_window(self, position: tuple[int, int] | None) -> tuple[tuple[tuple[int, int], ...], tuple[int, int]]:
+        # Cells and output cell of the given position, or of the coordinator's current position when None
+        if position is None:
+            return self._coordinator.get_affected_cells(), self._coordinator.get_output_cell()
+        return self._coordinator.get_window_cells(*position), position
+    
+    def _get_input_value(self, row: int, col: int) -> int | None:
+        # Taps outside the grid are read through the border mode; zero padding reads 0
+        grid_size = self._input_model.get_grid_size()
+        border_mode = self._coordinator.get_border_mode()
+        source_row = border_index(row, grid_size, border_mode)
+        source_col = border_index(col, grid_size, border_mode)
+        if source_row is None or source_col is None:
+            return 0
+        return self._input_model.get_value(source_row, source_col)
+    
     def _map_coordinates_to_kernel(self, row: int, col: int, output_cell: tuple[int, int], 
                                    kernel_size: int, filter_type: str) -> tuple[int, int]:
         offset_row = row - output_cell[0]
@@ -73,7 +188,7 @@ class BaseFilterCalculator(ABC):
         return kernel_row, kernel_col
     
     @abstractmethod
-    def _calculate_output(self, total_sum: float, kernel_area: int, calculations: list[dict]) -> float:
+    def _calculate_output(self, total_sum: float, kernel_area: int, calculations: list[CalculationRecord]) -> float:
         """
         Calculate the final output value from the weighted sum.
         
@@ -86,3 +201,17 @@ class BaseFilterCalculator(ABC):
             Final output pixel value
         """
         pass
+    
+    @abstractmethod
+    def _calculate_full_output(self, total_sums: np.ndarray, kernel_area: int) -> np.ndarray:
+        """
+        Calculate the final output values from the weighted sums of every window.
+        
+        Args:
+            total_sums: Bounded weighted sum for each kernel position
+            kernel_area: Total number of kernel elements
+            
+        Returns:
+            Final output pixel values, one per kernel position
+        """
+        pass
@@ -0,0 +1,40 @@
+from dataclasses import dataclass, field
+
+
+@dataclass(slots=True)
+class CalculationRecord:
+    """
+    One kernel tap of a step-by-step calculation.
+    
+    Records only hold the numbers; the strings shown in the calculation table are formatted
+    the first time display_texts() is called and then reused, so positions that are
+    calculated but never painted (playback, cache fills) cost no string formatting.
+    """
+    index: int
+    coordinate: tuple[int, int]
+    input_value: int | None
+    kernel_value: float
+    constant: float
+    final_kernel_value: float
+    result: float
+    bounded_result: float
+    # Position in the sorted window and whether the tap contributes to the median (Median only)
+    sorted_index: int | None = None
+    is_median: bool = False
+    _display_texts: tuple[str, ...] | None = field(default=None, init=False, repr=False, compare=False)
+    
+    def display_texts(self) -> tuple[str, ...]:
+        """
+        Return the table text for this tap: index, coordinates, value, calculation,
+        adjusted value and bounded value.
+        """
+        if self._display_texts is None:
+            self._display_texts = (
+                str(self.index),
+                f"({self.coordinate[0]},{self.coordinate[1]})",
+                str(self.input_value),
+                f"{self.input_value}×{self.final_kernel_value:.2f}",
+                f"{self.result:.2f}",
+                f"{self.bounded_result:.2f}"
+            )
+        return self._display_texts
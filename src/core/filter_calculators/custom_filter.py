@@ -1,21 +1,23 @@
+import numpy as np
 from utils.kernel_utils import flip_kernel_180
+from utils.filter_engine import custom_weighted_sum
 from .base_filter import BaseFilterCalculator
+from .calculation_record import CalculationRecord
 
 
 class CustomFilterCalculator(BaseFilterCalculator):
-    def calculate(self, constant: float, filter_type: str = "Cross-Correlation") -> dict:
+    def calculate(self, constant: float, filter_type: str = "Cross-Correlation",
+                  position: tuple[int, int] | None = None) -> dict:
         if filter_type == "Convolution":
-            return self._calculate_convolution(constant)
+            return self._calculate_convolution(constant, position)
         else:
-            return super().calculate(constant, filter_type)
+            return super().calculate(constant, filter_type, position)
     
-    def _calculate_convolution(self, constant: float) -> dict:
-        affected_cells = self._coordinator.get_affected_cells()
-        output_cell = self._coordinator.get_output_cell()
+    def _calculate_convolution(self, constant: float, position: tuple[int, int] | None = None) -> dict:
+        affected_cells, output_cell = self._get_window(position)
         
         kernel_size = self._kernel_model.get_grid_size()
         kernel_data = flip_kernel_180(self._kernel_model.get_grid_data())
-        input_data = self._input_model.get_grid_data()
         
         calculations = []
         total_sum = 0.0
@@ -27,10 +29,7 @@ class CustomFilterCalculator(BaseFilterCalculator):
             input_row = output_cell[0] - offset_row
             input_col = output_cell[1] - offset_col
             
-            if 0 <= input_row < len(input_data) and 0 <= input_col < len(input_data[0]):
-                input_value = input_data[input_row][input_col]
-            else:
-                input_value = 0
+            input_value = self._get_input_value(input_row, input_col)
             
             kernel_row, kernel_col = self._offset_to_kernel_indices(offset_row, offset_col, kernel_size)
             kernel_value = kernel_data[kernel_row][kernel_col]
@@ -38,17 +37,10 @@ class CustomFilterCalculator(BaseFilterCalculator):
             result = input_value * final_kernel_value
             bounded_result = max(0, min(255, result))
             
-            calculations.append({
-                'index': idx,
-                'coordinate': (input_row, input_col),
-                'input_value': input_value,
-                'kernel_value': kernel_value,
-                'constant': constant,
-                'final_kernel_value': final_kernel_value,
-                'calculation': f"({input_value}×{final_kernel_value:.2f})",
-                'result': result,
-                'bounded_result': bounded_result
-            })
+            calculations.append(CalculationRecord(
+                idx, (input_row, input_col), input_value, kernel_value, constant,
+                final_kernel_value, result, bounded_result
+            ))
             
             total_sum += bounded_result
         
@@ -63,5 +55,18 @@ class CustomFilterCalculator(BaseFilterCalculator):
             'output_cell': output_cell
         }
     
+    def _apply_valid(self, input_data: np.ndarray, constant: float, filter_type: str) -> np.ndarray:
+        kernel_size = self._kernel_model.get_grid_size()
+        kernel_data = self._kernel_model.get_grid_data()
+        
+        # Large kernels switch to the FFT backend automatically (see FFT_KERNEL_SIZE_THRESHOLD)
+        total_sums = custom_weighted_sum(input_data, kernel_data, constant, filter_type)
+        
+        kernel_area = kernel_size * kernel_size
+        return self._calculate_full_output(total_sums, kernel_area)
+    
     def _calculate_output(self, total_sum: float, kernel_area: int, calculations: list) -> float:
         return total_sum
+    
+    def _calculate_full_output(self, total_sums: np.ndarray, kernel_area: int) -> np.ndarray:
+        return total_sums
@@ -1,6 +1,27 @@
+import numpy as np
+from utils.filter_engine import gaussian_weighted_sum
 from .base_filter import BaseFilterCalculator
 
 
 class GaussianFilterCalculator(BaseFilterCalculator):
+    """
+    Gaussian filter calculator.
+    
+    The whole-image path applies the kernel as two 1D passes (rows, then columns) whenever
+    the kernel is separable and no term can be clamped; results then match the dense
+    per-term sum within SEPARABLE_TOLERANCE.
+    """
+    def _apply_valid(self, input_data: np.ndarray, constant: float, filter_type: str) -> np.ndarray:
+        kernel_size = self._kernel_model.get_grid_size()
+        kernel_data = self._kernel_model.get_grid_data()
+        
+        total_sums = gaussian_weighted_sum(input_data, kernel_data, constant)
+        
+        kernel_area = kernel_size * kernel_size
+        return self._calculate_full_output(total_sums, kernel_area)
+    
     def _calculate_output(self, total_sum: float, kernel_area: int, calculations: list) -> float:
-        return total_sum
\ No newline at end of file
+        return total_sum
+    
+    def _calculate_full_output(self, total_sums: np.ndarray, kernel_area: int) -> np.ndarray:
+        return total_sums
@@ -1,6 +1,53 @@
+import numpy as np
+from utils.filter_engine import uniform_kernel_weight, bounded_summed_area_table, mean_weighted_sum
 from .base_filter import BaseFilterCalculator
 
 
 class MeanFilterCalculator(BaseFilterCalculator):
+    """
+    Mean filter calculator.
+    
+    The whole-image path clamps each input value times the (uniform) kernel weight once,
+    builds a summed-area table of those terms per input version, and then answers every
+    window sum in O(1) regardless of kernel size. Non-uniform kernels fall back to the
+    per-tap path.
+    """
+    def __init__(self, input_model, kernel_model, coordinator):
+        super().__init__(input_model, kernel_model, coordinator)
+        # Cache key (whole-image input key, final kernel value) and summed-area table built for it
+        self._summed_area_key = None
+        self._summed_area_table = None
+    
+    def _apply_valid(self, input_data: np.ndarray, constant: float, filter_type: str) -> np.ndarray:
+        kernel_size = self._kernel_model.get_grid_size()
+        kernel_data = self._kernel_model.get_grid_data()
+        
+        # Reuse the cached summed-area table when the kernel is uniform
+        kernel_weight = uniform_kernel_weight(kernel_data)
+        table = None
+        if kernel_weight is not None:
+            table = self._get_summed_area_table(input_data, kernel_weight * constant)
+        total_sums = mean_weighted_sum(input_data, kernel_data, constant, table)
+        
+        kernel_area = kernel_size * kernel_size
+        return self._calculate_full_output(total_sums, kernel_area)
+    
+    def _get_summed_area_table(self, input_data: np.ndarray, final_kernel_value: float) -> np.ndarray:
+        # Only whole-image tables are cached; cropped inputs (apply_region) are rebuilt each time
+        is_whole_grid = self._input_key is not None
+        
+        key = (self._input_key, final_kernel_value)
+        if is_whole_grid and key == self._summed_area_key:
+            return self._summed_area_table
+        
+        table = bounded_summed_area_table(input_data, final_kernel_value)
+        if is_whole_grid:
+            self._summed_area_table = table
+            self._summed_area_key = key
+        return table
+    
     def _calculate_output(self, total_sum: float, kernel_area: int, calculations: list) -> float:
-        return total_sum / kernel_area
\ No newline at end of file
+        return total_sum / kernel_area
+    
+    def _calculate_full_output(self, total_sums: np.ndarray, kernel_area: int) -> np.ndarray:
+        return total_sums / kernel_area
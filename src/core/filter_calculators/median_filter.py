@@ -1,34 +1,30 @@
 from typing import Any
+import numpy as np
+from utils.filter_engine import median_filter
 from .base_filter import BaseFilterCalculator
+from .calculation_record import CalculationRecord
 
 
 class MedianFilterCalculator(BaseFilterCalculator):
-    def calculate(self, constant: float, filter_type: str = "Cross-Correlation") -> dict[str, Any]:
-        affected_cells = self._coordinator.get_affected_cells()
-        output_cell = self._coordinator.get_output_cell()
-        
-        input_data = self._input_model.get_grid_data()
+    def calculate(self, constant: float, filter_type: str = "Cross-Correlation",
+                  position: tuple[int, int] | None = None) -> dict[str, Any]:
+        affected_cells, output_cell = self._get_window(position)
         
         calculations = []
         pixel_values = []
         
         for idx, (row, col) in enumerate(affected_cells):
-            input_value = input_data[row][col]
+            input_value = self._get_input_value(row, col)
             pixel_values.append(input_value)
             
-            calculations.append({
-                'index': idx,
-                'coordinate': (row, col),
-                'input_value': input_value,
-                'kernel_value': 1.0,
-                'constant': constant,
-                'final_kernel_value': 1.0,
-                'calculation': str(input_value),
-                'result': input_value,
-                'bounded_result': input_value
-            })
+            calculations.append(CalculationRecord(
+                idx, (row, col), input_value, 1.0, constant, 1.0, input_value, input_value
+            ))
         
-        sorted_values = sorted(pixel_values)
+        # Sort once (stable, so equal values keep their window order) and reuse the order for both
+        # the sorted value list and each cell's sorted position
+        sorted_order = sorted(range(len(pixel_values)), key=pixel_values.__getitem__)
+        sorted_values = [pixel_values[original_idx] for original_idx in sorted_order]
         num_values = len(sorted_values)
         
         if num_values == 0:
@@ -47,10 +43,9 @@ class MedianFilterCalculator(BaseFilterCalculator):
             median_index = left_index
             median_value = (sorted_values[left_index] + sorted_values[right_index]) / 2.0
         
-        sorted_with_indices = sorted(enumerate(pixel_values), key=lambda x: x[1])
-        for sorted_pos, (original_idx, value) in enumerate(sorted_with_indices):
-            calculations[original_idx]['sorted_index'] = sorted_pos
-            calculations[original_idx]['is_median'] = (
+        for sorted_pos, original_idx in enumerate(sorted_order):
+            calculations[original_idx].sorted_index = sorted_pos
+            calculations[original_idx].is_median = (
                 sorted_pos == median_index or 
                 (num_values % 2 == 0 and sorted_pos in [left_index, right_index])
             )
@@ -63,9 +58,20 @@ class MedianFilterCalculator(BaseFilterCalculator):
             'output_cell': output_cell
         }
     
+    def _apply_valid(self, input_data: np.ndarray, constant: float, filter_type: str) -> np.ndarray:
+        kernel_size = self._kernel_model.get_grid_size()
+        return median_filter(input_data, kernel_size // 2)
+    
     def _calculate_output(self, total_sum: float, kernel_area: int, calculations: list) -> float:
         """
         Not used by median filter (uses sorting algorithm instead).
         Required to satisfy abstract method contract.
         """
         return 0.0
+    
+    def _calculate_full_output(self, total_sums: np.ndarray, kernel_area: int) -> np.ndarray:
+        """
+        Not used by median filter (medians are taken directly from the windows).
+        Required to satisfy abstract method contract.
+        """
+        return np.zeros_like(total_sums)
@@ -0,0 +1,92 @@
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class GridChange:
+    """
+    Compact description of a modification to a grid model.
+    
+    The dirty rectangle is [top, bottom) x [left, right) in cell coordinates. version is the
+    model's version after the change and only ever increases, so consumers can tell whether
+    they have already handled it. size is the grid size after the change.
+    """
+    top: int
+    left: int
+    bottom: int
+    right: int
+    version: int
+    size: int
+    
+    def is_full_grid(self) -> bool:
+        return (self.top, self.left, self.bottom, self.right) == (0, 0, self.size, self.size)
+    
+    def is_empty(self) -> bool:
+        return self.top >= self.bottom or self.left >= self.right
+
+
+def bounding_rect(first: tuple[int, int, int, int] | None,
+                  second: tuple[int, int, int, int]) -> tuple[int, int, int, int]:
+    """
+    Return the smallest (top, left, bottom, right) rectangle containing both rectangles.
+    
+    first may be None, in which case second is returned unchanged.
+    """
+    if first is None:
+        return second
+    return (min(first[0], second[0]), min(first[1], second[1]),
+            max(first[2], second[2]), max(first[3], second[3]))
+
+
+class ChangeTrackingMixin:
+    """
+    Version and change-notification bookkeeping shared by the grid models.
+    
+    A model calls _init_change_tracking() from __init__ and _notify_changed() after every
+    write, keeps its current size in self._size, declares a region_changed signal and
+    implements _emit_grid_changed() to emit its own grid_changed signal. Every write bumps
+    the version; writes made inside a batch() block are merged into one notification.
+    """
+    def _init_change_tracking(self) -> None:
+        self._version = 0
+        # Nesting depth of batch() blocks and the bounding rectangle of the writes made inside them
+        self._batch_depth = 0
+        self._pending_region = None
+    
+    def get_version(self) -> int:
+        return self._version
+    
+    def _notify_changed(self, top: int = 0, left: int = 0, bottom: int | None = None,
+                        right: int | None = None) -> None:
+        # Without a rectangle the whole grid is treated as modified
+        bottom = self._size if bottom is None else bottom
+        right = self._size if right is None else right
+        self._version += 1
+        if self._batch_depth > 0:
+            self._pending_region = bounding_rect(self._pending_region, (top, left, bottom, right))
+            return
+        self._emit_changed(top, left, bottom, right)
+    
+    @contextmanager
+    def batch(self):
+        """
+        Defer change notifications until the outermost batch() block exits, then emit once
+        for the bounding rectangle of every cell written inside it.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._pending_region is not None:
+                top, left, bottom, right = self._pending_region
+                self._pending_region = None
+                # Clip in case the grid shrank after the first write of the batch
+                self._emit_changed(top, left, min(bottom, self._size), min(right, self._size))
+    
+    def _emit_changed(self, top: int, left: int, bottom: int, right: int) -> None:
+        self._emit_grid_changed()
+        self.region_changed.emit(GridChange(top, left, bottom, right, self._version, self._size))
+    
+    def _emit_grid_changed(self) -> None:
+        raise NotImplementedError
@@ -1,15 +1,82 @@
 import cv2
-import easyocr
+import numpy as np
 from typing import Tuple
+from consts import OCR_BATCH_SIZE, OCR_RECOGNITION_ONLY, OCR_ALLOWLIST, OCR_LANGUAGES
+from .ocr_reader import get_reader
+from .ocr_cache import OcrResultCache
 
 
 class GridImageProcessor:
-    def __init__(self):
-        self.reader = easyocr.Reader(['en'], gpu=True)
+    """
+    Reads a photographed or rendered grid of numbers into grid data.
     
-    def process_image(self, image_path: str) -> tuple[bool, tuple[int, list[list[int]]] | None, str]:
+    Grid lines are detected with morphology, which already gives every cell's box. Cells are
+    read a batch of whole rows at a time (as many rows as fit in batch_size cells), with one
+    easyocr call per batch. In recognition-only mode the text detector is skipped: the cell
+    boxes of the batch go straight to the recognizer with a digits-only allowlist (on CPU
+    easyocr still recognizes them box by box). Otherwise every cell is cropped and binarized,
+    and the crops run through the full easyocr pipeline.
+    
+    Creating a processor is cheap: the easyocr Reader is shared process-wide and only
+    loaded on the first OCR call (see core.ocr_reader).
+    
+    With a cache, results are stored under a hash of the image bytes and these settings, so
+    importing the same image again skips line detection and OCR entirely.
+    """
+    def __init__(self, batch_size: int = OCR_BATCH_SIZE, recognition_only: bool = OCR_RECOGNITION_ONLY,
+                 cache: OcrResultCache | None = None):
+        self.batch_size = max(1, batch_size)
+        self.recognition_only = recognition_only
+        self.cache = cache
+    
+    @property
+    def reader(self):
+        return get_reader()
+    
+    def settings(self) -> dict:
+        """
+        Return the settings that affect OCR results, used in the cache key.
+        """
+        return {
+            "batch_size": self.batch_size,
+            "recognition_only": self.recognition_only,
+            "allowlist": OCR_ALLOWLIST,
+            "languages": OCR_LANGUAGES
+        }
+    
+    def process_image(self, image_path: str, progress=None,
+                      is_cancelled=None) -> tuple[bool, tuple[int, list[list[int]]] | None, str]:
+        """
+        Detect the grid in an image and read every cell value.
+        
+        Args:
+            image_path: Path to the grid image
+            progress: Optional callable(rows_done, total_rows), called after each batch of rows
+            is_cancelled: Optional callable checked between batches; processing stops early
+                and reports failure when it returns True
+        
+        Returns:
+            (success, (grid_size, grid_data) or None, message)
+        """
         try:
-            img = cv2.imread(image_path)
+            # Read the bytes once: they are hashed for the cache key and decoded from memory
+            try:
+                with open(image_path, "rb") as image_file:
+                    image_bytes = image_file.read()
+            except OSError:
+                return (False, None, "Failed to load image file")
+            
+            cache_key = None
+            if self.cache is not None:
+                cache_key = self.cache.make_key(image_bytes, self.settings())
+                entry = self.cache.get(cache_key)
+                if entry is not None:
+                    grid_size = entry["grid_size"]
+                    if progress is not None:
+                        progress(grid_size, grid_size)
+                    return (True, (grid_size, entry["values"]), self._validate_grid(grid_size, entry["values"])[1])
+            
+            img = cv2.imdecode(np.frombuffer(image_bytes, dtype=np.uint8), cv2.IMREAD_COLOR)
             if img is None:
                 return (False, None, "Failed to load image file")
             
@@ -20,7 +87,11 @@ class GridImageProcessor:
             if h_positions is None or v_positions is None:
                 return (False, None, "Failed to detect grid lines")
             
-            grid_size, grid_data = self._extract_cell_values(gray, h_positions, v_positions)
+            grid_size, grid_data, confidences = self._extract_cell_values(
+                gray, h_positions, v_positions, progress, is_cancelled
+            )
+            if is_cancelled is not None and is_cancelled():
+                return (False, None, "Import cancelled")
             if grid_size is None:
                 return (False, None, "Failed to extract grid values")
             
@@ -28,6 +99,9 @@ class GridImageProcessor:
             if not validation_result[0]:
                 return validation_result
             
+            if cache_key is not None:
+                self.cache.put(cache_key, grid_size, grid_data, confidences)
+            
             return (True, (grid_size, grid_data), validation_result[1])
             
         except Exception as e:
@@ -112,48 +186,76 @@ class GridImageProcessor:
                 return None
         return None
     
-    def _extract_cell_values(self, gray: cv2.Mat, h_positions: list[int], v_positions: list[int]) -> tuple[int | None, list[list[int]] | None]:
+    def _extract_cell_values(self, gray: cv2.Mat, h_positions: list[int], v_positions: list[int],
+                             progress=None, is_cancelled=None
+                             ) -> tuple[int | None, list[list[int]] | None, list[list[float | None]] | None]:
+        """
+        Read every cell between the detected grid lines.
+        
+        Returns:
+            (grid_size, grid_data, confidences), where confidences holds the OCR confidence of
+            each cell (None where it could not be read), or (None, None, None) on failure
+        """
         num_rows = len(h_positions) - 1
         num_cols = len(v_positions) - 1
         
         if num_rows != num_cols:
-            return (None, None)
+            return (None, None, None)
         
         if num_rows < 3 or num_rows > 20:
-            return (None, None)
+            return (None, None, None)
         
         grid_size = num_rows
-        grid_data = []
+        grid_data = [[0] * grid_size for _ in range(grid_size)]
+        confidences = [[None] * grid_size for _ in range(grid_size)]
         ocr_failures = 0
         ocr_failure_details = []
         total_cells = grid_size * grid_size
         
-        for row_idx in range(grid_size):
-            row_data = []
-            y_start = h_positions[row_idx]
-            y_end = h_positions[row_idx + 1] if row_idx + 1 < len(h_positions) else gray.shape[0]
+        # Read whole rows per OCR call, as many as fit in one batch, so progress can be
+        # reported (and cancellation checked) between calls
+        rows_per_batch = max(1, self.batch_size // grid_size)
+        for first_row in range(0, grid_size, rows_per_batch):
+            if is_cancelled is not None and is_cancelled():
+                return (None, None, None)
             
-            for col_idx in range(grid_size):
-                x_start = v_positions[col_idx]
-                x_end = v_positions[col_idx + 1] if col_idx + 1 < len(v_positions) else gray.shape[1]
-                
-                cell_img = gray[y_start:y_end, x_start:x_end]
+            cells = []
+            boxes = []
+            for row_idx in range(first_row, min(grid_size, first_row + rows_per_batch)):
+                y_start = h_positions[row_idx]
+                y_end = h_positions[row_idx + 1] if row_idx + 1 < len(h_positions) else gray.shape[0]
                 
-                if cell_img.size == 0:
-                    row_data.append(0)
-                    ocr_failures += 1
-                    ocr_failure_details.append(f"Cell ({row_idx}, {col_idx}): empty")
-                    continue
-                
-                cell_value = self._process_ocr_cell(cell_img, row_idx, col_idx)
+                for col_idx in range(grid_size):
+                    x_start = v_positions[col_idx]
+                    x_end = v_positions[col_idx + 1] if col_idx + 1 < len(v_positions) else gray.shape[1]
+                    
+                    cell_img = gray[y_start:y_end, x_start:x_end]
+                    
+                    if cell_img.size == 0:
+                        ocr_failures += 1
+                        ocr_failure_details.append(f"Cell ({row_idx}, {col_idx}): empty")
+                        continue
+                    
+                    cells.append((row_idx, col_idx))
+                    boxes.append((x_start, x_end, y_start, y_end))
+            
+            if self.recognition_only:
+                cell_results = self._recognize_cells(gray, boxes)
+            else:
+                crops = [self._preprocess_cell(gray[y_start:y_end, x_start:x_end]) for x_start, x_end, y_start, y_end in boxes]
+                cell_results = self._read_cells(crops)
+            
+            for (row_idx, col_idx), results in zip(cells, cell_results):
+                cell_value = self._parse_cell_value(results)
                 if cell_value is None:
                     ocr_failures += 1
                     ocr_failure_details.append(f"Cell ({row_idx}, {col_idx}): OCR failed")
-                    row_data.append(0)
                 else:
-                    row_data.append(cell_value)
+                    grid_data[row_idx][col_idx] = cell_value
+                    confidences[row_idx][col_idx] = float(results[0][2])
             
-            grid_data.append(row_data)
+            if progress is not None:
+                progress(min(grid_size, first_row + rows_per_batch), grid_size)
         
         failure_rate = ocr_failures / total_cells if total_cells > 0 else 1.0
         if failure_rate > 0.3:
@@ -161,24 +263,78 @@ class GridImageProcessor:
             failure_msg += f"First few failures: {', '.join(ocr_failure_details[:5])}"
             if len(ocr_failure_details) > 5:
                 failure_msg += f" ... and {len(ocr_failure_details) - 5} more"
-            return (None, None)
+            return (None, None, None)
         
         if ocr_failures > 0:
-            return (grid_size, grid_data)
+            return (grid_size, grid_data, confidences)
         
-        return (grid_size, grid_data)
+        return (grid_size, grid_data, confidences)
     
-    def _process_ocr_cell(self, cell_img: cv2.Mat, row_idx: int, col_idx: int) -> int | None:
+    def _preprocess_cell(self, cell_img: cv2.Mat) -> cv2.Mat:
         _, cell_binary = cv2.threshold(cell_img, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
         
         padding = 5
-        cell_img_padded = cv2.copyMakeBorder(
+        return cv2.copyMakeBorder(
             cell_binary, padding, padding, padding, padding,
             cv2.BORDER_CONSTANT, value=0
         )
+    
+    def _read_cells(self, crops: list[cv2.Mat]) -> list[list]:
+        """
+        Run OCR over the cell crops batch_size at a time, one easyocr call per batch.
         
-        results = self.reader.readtext(cell_img_padded)
+        easyocr stacks a batch into one tensor, so each batch is resized to its largest crop.
         
+        Returns:
+            One list of (box, text, confidence) detections per crop, in input order
+        """
+        results = []
+        for start in range(0, len(crops), self.batch_size):
+            batch = crops[start:start + self.batch_size]
+            n_height = max(crop.shape[0] for crop in batch)
+            n_width = max(crop.shape[1] for crop in batch)
+            results.extend(self.reader.readtext_batched(
+                batch, n_width=n_width, n_height=n_height, batch_size=self.batch_size
+            ))
+        return results
+    
+    def _recognize_cells(self, gray: cv2.Mat, boxes: list[tuple[int, int, int, int]]) -> list[list]:
+        """
+        Recognize every cell box in one recognizer pass over the image, skipping text detection.
+        
+        Boxes are inset past the grid lines so the lines are not read as digits. easyocr may
+        return the boxes sorted by position, so each result is matched back to its cell by
+        the top-left corner of its box.
+        
+        Args:
+            gray: Grayscale grid image
+            boxes: (x_start, x_end, y_start, y_end) of each cell
+        
+        Returns:
+            One list of (box, text, confidence) detections per cell box, in input order
+        """
+        horizontal_list = [self._inset_box(box) for box in boxes]
+        detections = self.reader.recognize(
+            gray, horizontal_list=horizontal_list, free_list=[],
+            allowlist=OCR_ALLOWLIST, batch_size=self.batch_size
+        )
+        
+        index_by_corner = {(x_min, y_min): index for index, (x_min, _, y_min, _) in enumerate(horizontal_list)}
+        results = [[] for _ in boxes]
+        for detection in detections:
+            corner = (int(detection[0][0][0]), int(detection[0][0][1]))
+            index = index_by_corner.get(corner)
+            if index is not None:
+                results[index].append(detection)
+        return results
+    
+    def _inset_box(self, box: tuple[int, int, int, int]) -> list[int]:
+        x_start, x_end, y_start, y_end = box
+        margin = max(2, min(x_end - x_start, y_end - y_start) // 10)
+        return [x_start + margin, max(x_start + margin + 1, x_end - margin),
+                y_start + margin, max(y_start + margin + 1, y_end - margin)]
+    
+    def _parse_cell_value(self, results: list) -> int | None:
         if not results:
             return None
         
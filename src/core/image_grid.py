@@ -1,44 +1,169 @@
+import numpy as np
 from PySide6.QtCore import QObject, Signal
+from .grid_change import ChangeTrackingMixin
 
 
-class ImageGridModel(QObject):
+class ImageGridModel(QObject, ChangeTrackingMixin):
     """
     Model representing a 2D grid of pixel values for input or output images.
     
-    Emits grid_changed signal when grid size or cell values are modified.
+    Pixels are stored in a contiguous uint8 array, with a boolean mask marking the cells
+    that hold no value (None), as the output image does before a position is calculated.
+    get_array() and get_mask() return zero-copy read-only views and the model itself
+    supports the buffer protocol, so NumPy, cv2 and QImage can read the pixels without
+    conversion. get_grid_data() still returns the list-of-lists form for compatibility.
+    
+    Emits grid_changed signal (size, read-only pixel array) when grid size or cell values
+    are modified, followed by region_changed with a GridChange describing the dirty
+    rectangle and the new version, so listeners can repaint or recompute only the affected
+    cells instead of treating every change as a full reset. Every modification bumps the
+    version so derived data (e.g. summed-area tables) can be cached per input version.
+    
+    Writes made inside a batch() block, or through set_region()/set_array(), emit a single
+    grid_changed/region_changed pair covering every modified cell once they are all applied.
     """
-    grid_changed = Signal(int, list)
+    grid_changed = Signal(int, object)
+    region_changed = Signal(object)
     
     def __init__(self, size: int, initial_value: int | None = 255):
         super().__init__()
         self._size = size
         self._initial_value = initial_value
-        self._grid_data = self._create_grid(size, initial_value)
+        self._values, self._mask = self._create_grid(size, initial_value)
+        self._init_change_tracking()
+        # List-of-lists copy for get_grid_data(), rebuilt only when the version changes
+        self._grid_data = None
+        self._grid_data_version = None
+    
+    def _create_grid(self, size: int, initial_value: int | None = 255) -> tuple[np.ndarray, np.ndarray]:
+        values = np.full((size, size), 0 if initial_value is None else initial_value, dtype=np.uint8)
+        mask = np.full((size, size), initial_value is None, dtype=bool)
+        return values, mask
     
-    def _create_grid(self, size: int, initial_value: int | None = 255) -> list[list[int | None]]:
-        return [[initial_value for _ in range(size)] for _ in range(size)]
+    def _emit_grid_changed(self) -> None:
+        self.grid_changed.emit(self._size, self.get_array())
+    
+    def __buffer__(self, flags: int) -> memoryview:
+        # Read-only buffer over the pixel values; cells with no value read as 0 (see get_mask())
+        return memoryview(self._values).toreadonly()
     
     def set_grid_size(self, size: int) -> None:
         self._size = size
-        self._grid_data = self._create_grid(size, self._initial_value)
-        self.grid_changed.emit(size, self._grid_data)
+        self._values, self._mask = self._create_grid(size, self._initial_value)
+        self._notify_changed(0, 0, size, size)
+    
+    def get_array(self) -> np.ndarray:
+        """
+        Return a zero-copy, read-only (size, size) uint8 view of the pixel values.
+        
+        Cells with no value read as 0; use get_mask() to tell them apart.
+        """
+        view = self._values.view()
+        view.flags.writeable = False
+        return view
+    
+    def get_mask(self) -> np.ndarray:
+        """
+        Return a zero-copy, read-only (size, size) boolean view that is True where a cell has no value.
+        """
+        view = self._mask.view()
+        view.flags.writeable = False
+        return view
     
     def get_grid_data(self) -> list[list[int | None]]:
+        """
+        Return the grid as a list of lists with None for cells that have no value.
+        
+        The list is a snapshot for compatibility with code written against the list-backed
+        model; it is rebuilt once per version and changing it does not modify the model.
+        """
+        if self._grid_data_version != self._version:
+            grid_data = self._values.tolist()
+            if self._mask.any():
+                for row, col in zip(*np.nonzero(self._mask)):
+                    grid_data[row][col] = None
+            self._grid_data = grid_data
+            self._grid_data_version = self._version
         return self._grid_data
     
     def get_grid_size(self) -> int:
         return self._size
     
+    def get_value(self, row: int, col: int) -> int | None:
+        if 0 <= row < self._size and 0 <= col < self._size:
+            if self._mask[row, col]:
+                return None
+            return int(self._values[row, col])
+        return None
+    
     def set_cell(self, row: int, col: int, value: int | None) -> None:
         if 0 <= row < self._size and 0 <= col < self._size:
-            self._grid_data[row][col] = value
-            self.grid_changed.emit(self._size, self._grid_data)
+            self._values[row, col] = 0 if value is None else value
+            self._mask[row, col] = value is None
+            self._notify_changed(row, col, row + 1, col + 1)
     
     def clear_grid(self) -> None:
-        self._grid_data = self._create_grid(self._size, None)
-        self.grid_changed.emit(self._size, self._grid_data)
+        self._values, self._mask = self._create_grid(self._size, None)
+        self._notify_changed(0, 0, self._size, self._size)
     
-    def set_grid_data(self, size: int, grid_data: list[list[int]]) -> None:
+    def set_grid_data(self, size: int, grid_data: list[list[int | None]] | np.ndarray) -> None:
         self._size = size
-        self._grid_data = grid_data
-        self.grid_changed.emit(self._size, self._grid_data)
\ No newline at end of file
+        if isinstance(grid_data, np.ndarray):
+            self._values = np.array(grid_data, dtype=np.uint8)
+            self._mask = np.zeros((size, size), dtype=bool)
+        else:
+            self._mask = np.array([[value is None for value in row] for row in grid_data], dtype=bool)
+            self._values = np.array(
+                [[0 if value is None else value for value in row] for row in grid_data], dtype=np.uint8
+            )
+        self._notify_changed(0, 0, self._size, self._size)
+    
+    def set_region(self, top: int, left: int, values: list[list[int | None]] | np.ndarray,
+                   mask: np.ndarray | None = None) -> None:
+        """
+        Write a 2D block of values with its top-left corner at (top, left) and notify once.
+        
+        Args:
+            top, left: Grid cell where the block starts
+            values: 2D list (None for cells with no value) or uint8-compatible array;
+                parts that fall outside the grid are ignored
+            mask: Optional boolean array with the shape of an array block, True where a
+                cell has no value
+        """
+        if isinstance(values, np.ndarray):
+            block_values = values
+            block_mask = np.zeros(values.shape, dtype=bool) if mask is None else np.asarray(mask, dtype=bool)
+        else:
+            block_mask = np.array([[value is None for value in row] for row in values], dtype=bool)
+            block_values = np.array([[0 if value is None else value for value in row] for row in values])
+        if block_values.ndim != 2:
+            return
+        
+        # Clip the block to the grid
+        bottom = min(self._size, top + block_values.shape[0])
+        right = min(self._size, left + block_values.shape[1])
+        row_start, col_start = max(0, -top), max(0, -left)
+        top, left = max(0, top), max(0, left)
+        if top >= bottom or left >= right:
+            return
+        
+        block = (slice(row_start, row_start + bottom - top), slice(col_start, col_start + right - left))
+        self._values[top:bottom, left:right] = block_values[block]
+        self._mask[top:bottom, left:right] = block_mask[block]
+        self._notify_changed(top, left, bottom, right)
+    
+    def set_array(self, values: np.ndarray, mask: np.ndarray | None = None) -> None:
+        """
+        Replace every cell (and the grid size) from a square 2D array and notify once.
+        
+        Args:
+            values: (size, size) array of pixel values, copied into the model as uint8
+            mask: Optional (size, size) boolean array, True where a cell has no value
+        """
+        self._values = np.array(values, dtype=np.uint8)
+        self._size = self._values.shape[0]
+        if mask is None:
+            self._mask = np.zeros(self._values.shape, dtype=bool)
+        else:
+            self._mask = np.array(mask, dtype=bool)
+        self._notify_changed(0, 0, self._size, self._size)
@@ -1,5 +1,7 @@
 from enum import Enum
+from collections.abc import Iterator
 from PySide6.QtCore import QObject, Signal
+from consts import DEFAULT_BORDER_MODE
 
 
 class ApplicationState(Enum):
@@ -15,8 +17,25 @@ class KernelApplicationCoordinator(QObject):
     
     Manages the current position of the kernel as it moves across the input grid,
     tracking which cells are affected and where output values should be written.
+    
+    With the "Valid Only" border mode the kernel only visits positions whose window fits
+    inside the grid (k..N-1-k). Any other border mode visits every cell, and the affected
+    cells then include coordinates outside the grid that the calculators read through the
+    border mode.
+    
+    Window coordinates come from an offset table precomputed per kernel radius. The cells
+    of each position's window are built once per (grid size, kernel radius, border mode)
+    and shared as an immutable tuple by every consumer, including calculations for explicit
+    positions (lookahead, cache fills), until one of those settings changes.
+    
+    Positions are numbered in raster order (0 .. position_count() - 1). seek() jumps to any
+    of them with a single position_changed emission, and iter_positions() walks them
+    without moving the kernel or emitting any signal. advance() moves forward several
+    positions at once and reports the ones stepped over with positions_skipped(start, stop),
+    a half-open range of indices, so listeners can fill in their results in bulk.
     """
     position_changed = Signal(int, int)
+    positions_skipped = Signal(int, int)
     state_changed = Signal(object)
     
     def __init__(self, grid_size: int, kernel_size: int):
@@ -25,9 +44,16 @@ class KernelApplicationCoordinator(QObject):
         self._grid_size = grid_size
         # Store the kernel radius (k, where full kernel is 2k+1)
         self._kernel_size = kernel_size
+        # Row-major (row, col) offsets of every tap relative to the kernel center
+        self._window_offsets = self._build_window_offsets(kernel_size)
+        # Window cells per (row, col), valid for the (grid size, kernel radius, border mode) in the key
+        self._window_table = {}
+        self._window_table_key = None
+        # Store how taps outside the grid are read (see BORDER_MODES)
+        self._border_mode = DEFAULT_BORDER_MODE
         # Initialize current position to the first valid position (kernel_size, kernel_size)
-        self._current_row = kernel_size
-        self._current_col = kernel_size
+        self._current_row = self._get_min_row()
+        self._current_col = self._get_min_col()
         # Start in INITIAL state
         self._state = ApplicationState.INITIAL
     
@@ -42,8 +68,8 @@ class KernelApplicationCoordinator(QObject):
     
     def reset(self) -> None:
         # Reset position to the initial starting position
-        self._current_row = self._kernel_size
-        self._current_col = self._kernel_size
+        self._current_row = self._get_min_row()
+        self._current_col = self._get_min_col()
         # Return to INITIAL state
         self._state = ApplicationState.INITIAL
         self.state_changed.emit(self._state)
@@ -96,24 +122,109 @@ class KernelApplicationCoordinator(QObject):
         return not (self._current_row == self._get_min_row() and 
                    self._current_col == self._get_min_col())
     
-    def get_affected_cells(self) -> list[tuple[int, int]]:
-        # Return list of all grid cells that fall within the kernel centered at current position
-        cells = []
-        kernel_radius = self._kernel_size
+    def advance(self, count: int) -> None:
+        # Move forward count positions (stopping at the last one) with a single position_changed emission
+        if self._state != ApplicationState.NAVIGATING or count <= 0:
+            return
+        
+        index = self.get_position_index()
+        target = min(index + count, self.position_count() - 1)
+        if target <= index:
+            return
+        if target > index + 1:
+            self.positions_skipped.emit(index + 1, target)
+        self.seek(target)
+    
+    def seek(self, index_or_row: int, col: int | None = None) -> None:
+        """
+        Jump directly to a position and emit position_changed once.
+        
+        Args:
+            index_or_row: Linear position index (see position_count()), or the row when col is given
+            col: Column of the position; omit to seek by linear index
+        
+        Raises:
+            IndexError: If the index or (row, col) is not a position the kernel visits
+        """
+        # Only seek while navigating, like next() and previous()
+        if self._state != ApplicationState.NAVIGATING:
+            return
+        
+        if col is None:
+            row, col = self.position_at(index_or_row)
+        else:
+            row = index_or_row
+            if not (self._get_min_row() <= row <= self._get_max_row() and
+                    self._get_min_col() <= col <= self._get_max_col()):
+                raise IndexError(f"Position ({row}, {col}) is outside the visited positions")
+        
+        if (row, col) == (self._current_row, self._current_col):
+            return
+        self._current_row = row
+        self._current_col = col
+        self.position_changed.emit(self._current_row, self._current_col)
+    
+    def position_count(self) -> int:
+        # Number of positions the kernel visits with the current grid size, kernel size and border mode
+        rows = max(0, self._get_max_row() - self._get_min_row() + 1)
+        cols = max(0, self._get_max_col() - self._get_min_col() + 1)
+        return rows * cols
+    
+    def get_position_index(self) -> int:
+        # Linear (raster-order) index of the current position
+        cols = self._get_max_col() - self._get_min_col() + 1
+        return (self._current_row - self._get_min_row()) * cols + (self._current_col - self._get_min_col())
+    
+    def position_at(self, index: int) -> tuple[int, int]:
+        # Convert a linear position index to the (row, col) of the kernel center
+        if not 0 <= index < self.position_count():
+            raise IndexError(f"Position index {index} out of range (0..{self.position_count() - 1})")
+        cols = self._get_max_col() - self._get_min_col() + 1
+        row_offset, col_offset = divmod(index, cols)
+        return self._get_min_row() + row_offset, self._get_min_col() + col_offset
+    
+    def iter_positions(self, start: int = 0) -> Iterator[tuple[int, int]]:
+        """
+        Yield every visited (row, col) position in raster order, starting at linear index start.
+        
+        Does not move the kernel or emit signals, so tools can walk the positions headlessly.
+        """
+        for index in range(max(0, start), self.position_count()):
+            yield self.position_at(index)
+    
+    def get_affected_cells(self) -> tuple[tuple[int, int], ...]:
+        # Return all grid cells that fall within the kernel centered at current position
+        return self.get_window_cells(self._current_row, self._current_col)
+    
+    def get_window_cells(self, row: int, col: int) -> tuple[tuple[int, int], ...]:
+        """
+        Return the cells under the kernel centered at (row, col), in row-major tap order.
         
-        # Iterate through all positions in the kernel window
-        for row_offset in range(-kernel_radius, kernel_radius + 1):
-            for col_offset in range(-kernel_radius, kernel_radius + 1):
-                # Calculate absolute grid coordinates
-                cell_row = self._current_row + row_offset
-                cell_col = self._current_col + col_offset
-                
-                # Only include cells that are within the grid bounds
-                if 0 <= cell_row < self._grid_size and 0 <= cell_col < self._grid_size:
-                    cells.append((cell_row, cell_col))
+        Cells outside the grid are only included when a border mode supplies them.
+        """
+        key = (self._grid_size, self._kernel_size, self._border_mode)
+        if key != self._window_table_key:
+            # Replace rather than clear, so a lookahead thread holding the old table is unaffected
+            self._window_table = {}
+            self._window_table_key = key
+        window_table = self._window_table
         
+        cells = window_table.get((row, col))
+        if cells is None:
+            k = self._kernel_size
+            rows = range(row - k, row + k + 1)
+            cols = range(col - k, col + k + 1)
+            if self._border_mode == "Valid Only":
+                rows = range(max(0, rows.start), min(self._grid_size, rows.stop))
+                cols = range(max(0, cols.start), min(self._grid_size, cols.stop))
+            cells = tuple([(cell_row, cell_col) for cell_row in rows for cell_col in cols])
+            window_table[(row, col)] = cells
         return cells
     
+    def get_window_offsets(self) -> tuple[tuple[int, int], ...]:
+        # Return the (row, col) offsets of every tap from the kernel center, in row-major order
+        return self._window_offsets
+    
     def get_output_cell(self) -> tuple[int, int]:
         # Return the current center position (the output cell for the convolution)
         return (self._current_row, self._current_col)
@@ -128,22 +239,42 @@ class KernelApplicationCoordinator(QObject):
         self.reset()
     
     def set_kernel_size(self, size: int) -> None:
-        # Update kernel size and reset to initial state
+        # Update kernel size, rebuild the window offsets and reset to initial state
         self._kernel_size = size
+        self._window_offsets = self._build_window_offsets(size)
         self.reset()
     
+    def get_border_mode(self) -> str:
+        # Return how taps outside the grid are read
+        return self._border_mode
+    
+    def set_border_mode(self, border_mode: str) -> None:
+        # Update border mode and reset to initial state (the set of visited positions may change)
+        self._border_mode = border_mode
+        self.reset()
+    
+    @staticmethod
+    def _build_window_offsets(kernel_radius: int) -> tuple[tuple[int, int], ...]:
+        # Offsets for every tap of a (2k+1)x(2k+1) window, in the same order as the calculators visit them
+        span = range(-kernel_radius, kernel_radius + 1)
+        return tuple((row_offset, col_offset) for row_offset in span for col_offset in span)
+    
+    def _get_border_margin(self) -> int:
+        # Distance from the edge to the first visited position (0 when a border mode pads the grid)
+        return self._kernel_size if self._border_mode == "Valid Only" else 0
+    
     def _get_min_row(self) -> int:
         # Minimum valid row position (kernel radius from top edge)
-        return self._kernel_size
+        return self._get_border_margin()
     
     def _get_min_col(self) -> int:
         # Minimum valid column position (kernel radius from left edge)
-        return self._kernel_size
+        return self._get_border_margin()
     
     def _get_max_row(self) -> int:
         # Maximum valid row position (kernel radius from bottom edge)
-        return self._grid_size - 1 - self._kernel_size
+        return self._grid_size - 1 - self._get_border_margin()
     
     def _get_max_col(self) -> int:
         # Maximum valid column position (kernel radius from right edge)
-        return self._grid_size - 1 - self._kernel_size
\ No newline at end of file
+        return self._grid_size - 1 - self._get_border_margin()
\ No newline at end of file
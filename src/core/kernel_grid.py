@@ -1,26 +1,38 @@
 from PySide6.QtCore import QObject, Signal
+from .grid_change import ChangeTrackingMixin, bounding_rect
 
 
-class KernelGridModel(QObject):
+class KernelGridModel(QObject, ChangeTrackingMixin):
     """
     Model representing a 2D grid of kernel weights for filter operations.
     
-    Emits grid_changed signal when kernel size or weights are modified.
+    Emits grid_changed signal when kernel size or weights are modified, followed by
+    region_changed with a GridChange describing the dirty rectangle and the new version.
+    Every modification bumps the version so results derived from the weights can be cached
+    per kernel version.
+    
+    Writes made inside a batch() block, or through set_region()/set_array(), emit a single
+    grid_changed once they are all applied.
     """
     grid_changed = Signal(int, list)
+    region_changed = Signal(object)
     
     def __init__(self, size: int):
         super().__init__()
         self._size = size
         self._grid_data = self._create_grid(size)
+        self._init_change_tracking()
     
     def _create_grid(self, size: int) -> list[list[float]]:
         return [[1.0 for _ in range(size)] for _ in range(size)]
     
+    def _emit_grid_changed(self) -> None:
+        self.grid_changed.emit(self._size, self._grid_data)
+    
     def set_grid_size(self, size: int) -> None:
         self._size = size
         self._grid_data = self._create_grid(size)
-        self.grid_changed.emit(size, self._grid_data)
+        self._notify_changed()
     
     def get_grid_data(self) -> list[list[float]]:
         return self._grid_data
@@ -31,7 +43,7 @@ class KernelGridModel(QObject):
     def set_cell(self, row: int, col: int, value: float) -> None:
         if 0 <= row < self._size and 0 <= col < self._size:
             self._grid_data[row][col] = value
-            self.grid_changed.emit(self._size, self._grid_data)
+            self._notify_changed(row, col, row + 1, col + 1)
     
     def get_value(self, row: int, col: int) -> float:
         if 0 <= row < self._size and 0 <= col < self._size:
@@ -42,4 +54,33 @@ class KernelGridModel(QObject):
         for row in range(self._size):
             for col in range(self._size):
                 self._grid_data[row][col] = value
-        self.grid_changed.emit(self._size, self._grid_data)
\ No newline at end of file
+        self._notify_changed()
+    
+    def set_region(self, top: int, left: int, values) -> None:
+        """
+        Write a 2D block of weights with its top-left corner at (top, left) and notify once.
+        
+        Args:
+            top, left: Kernel cell where the block starts
+            values: 2D list or array of weights; parts outside the kernel are ignored
+        """
+        dirty_region = None
+        for row_offset, row_values in enumerate(values):
+            row = top + row_offset
+            if not 0 <= row < self._size:
+                continue
+            for col_offset, value in enumerate(row_values):
+                col = left + col_offset
+                if 0 <= col < self._size:
+                    self._grid_data[row][col] = float(value)
+                    dirty_region = bounding_rect(dirty_region, (row, col, row + 1, col + 1))
+        if dirty_region is not None:
+            self._notify_changed(*dirty_region)
+    
+    def set_array(self, values) -> None:
+        """
+        Replace every weight (and the kernel size) from a square 2D list or array and notify once.
+        """
+        self._grid_data = [[float(value) for value in row_values] for row_values in values]
+        self._size = len(self._grid_data)
+        self._notify_changed()
@@ -0,0 +1,157 @@
+import os
+import json
+import hashlib
+import threading
+from typing import Any
+from consts import OCR_CACHE_DIR_ENV, OCR_CACHE_MAX_BYTES, OCR_CACHE_VERSION
+
+
+def default_cache_directory() -> str:
+    """
+    Return the OCR cache directory: OCR_CACHE_DIR_ENV when set, otherwise
+    ~/.cache/cv_playground/ocr.
+    """
+    return os.environ.get(OCR_CACHE_DIR_ENV) or os.path.join(
+        os.path.expanduser("~"), ".cache", "cv_playground", "ocr"
+    )
+
+
+class OcrResultCache:
+    """
+    On-disk cache of grid image OCR results, one JSON file per entry.
+    
+    Entries are content-addressed: the key is a sha256 of the image bytes and the processor
+    settings, so renaming or moving an image still hits, and editing it or changing a setting
+    misses. Each entry holds the grid size, the cell values and the per-cell confidence.
+    
+    The total size of the directory is bounded by max_bytes. A hit refreshes the entry's
+    modification time, and every put evicts the least recently used files (oldest mtime)
+    until the cache fits again. Files are written to a temporary name and renamed into place,
+    so an interrupted write or a concurrent app instance never leaves a partial entry.
+    """
+    def __init__(self, directory: str | None = None, max_bytes: int = OCR_CACHE_MAX_BYTES):
+        self._directory = directory or default_cache_directory()
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def make_key(image_bytes: bytes, settings: dict[str, Any]) -> str:
+        digest = hashlib.sha256(image_bytes)
+        digest.update(json.dumps({"version": OCR_CACHE_VERSION, **settings}, sort_keys=True).encode())
+        return digest.hexdigest()
+    
+    def get(self, key: str) -> dict[str, Any] | None:
+        """
+        Return the entry stored under key, or None on a miss or an unreadable entry.
+        """
+        path = self._entry_path(key)
+        with self._lock:
+            try:
+                with open(path) as entry_file:
+                    entry = json.load(entry_file)
+            except FileNotFoundError:
+                return None
+            except OSError:
+                # Unreadable (e.g. permissions), leave it for its owner
+                return None
+            except ValueError:
+                # Corrupt entry, treat it as a miss and let the next put replace it
+                self._remove(path)
+                return None
+            
+            if not self._is_valid_entry(entry):
+                self._remove(path)
+                return None
+            
+            # Refresh the LRU order; a read-only or shared cache directory still serves hits
+            try:
+                os.utime(path)
+            except OSError:
+                pass
+        return entry
+    
+    def put(self, key: str, grid_size: int, values: list[list[int]],
+            confidences: list[list[float | None]]) -> None:
+        """
+        Store an OCR result and evict old entries past the size bound.
+        
+        Failing to write (read-only or full disk) only means the result is not cached.
+        """
+        entry = {"grid_size": grid_size, "values": values, "confidences": confidences}
+        path = self._entry_path(key)
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with self._lock:
+            try:
+                os.makedirs(self._directory, exist_ok=True)
+                with open(temp_path, "w") as entry_file:
+                    json.dump(entry, entry_file)
+                os.replace(temp_path, path)
+            except OSError:
+                self._remove(temp_path)
+                return
+            self._evict()
+    
+    def clear(self) -> None:
+        with self._lock:
+            for path, _, _ in self._list_entries():
+                self._remove(path)
+    
+    @staticmethod
+    def _is_valid_entry(entry: Any) -> bool:
+        # A square grid of ints, and confidences (when present) of the same shape
+        if not isinstance(entry, dict):
+            return False
+        grid_size = entry.get("grid_size")
+        values = entry.get("values")
+        if type(grid_size) is not int or grid_size < 1 or not isinstance(values, list) or len(values) != grid_size:
+            return False
+        if not all(isinstance(row, list) and len(row) == grid_size and
+                   all(type(value) is int for value in row) for row in values):
+            return False
+        confidences = entry.get("confidences")
+        return confidences is None or (
+            isinstance(confidences, list) and len(confidences) == grid_size and
+            all(isinstance(row, list) and len(row) == grid_size for row in confidences)
+        )
+    
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self._directory, f"{key}.json")
+    
+    def _list_entries(self) -> list[tuple[str, float, int]]:
+        """
+        Return (path, mtime, size) of every entry file in the cache directory.
+        """
+        entries = []
+        try:
+            with os.scandir(self._directory) as directory:
+                for item in directory:
+                    if not item.name.endswith(".json"):
+                        continue
+                    try:
+                        stat = item.stat()
+                    except OSError:
+                        continue
+                    entries.append((item.path, stat.st_mtime, stat.st_size))
+        except OSError:
+            pass
+        return entries
+    
+    def _evict(self) -> None:
+        entries = self._list_entries()
+        total_bytes = sum(size for _, _, size in entries)
+        if total_bytes <= self._max_bytes:
+            return
+        
+        entries.sort(key=lambda entry: entry[1])
+        for path, _, size in entries:
+            if total_bytes <= self._max_bytes:
+                break
+            self._remove(path)
+            total_bytes -= size
+    
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
@@ -0,0 +1,52 @@
+import os
+import threading
+from consts import OCR_LANGUAGES, OCR_MODEL_DIR_ENV
+
+# Process-wide easyocr Reader, created on first use
+_reader = None
+_reader_lock = threading.Lock()
+
+
+def get_model_directory() -> str | None:
+    """
+    Return the directory the easyocr model weights are loaded from.
+    
+    Set the OCR_MODEL_DIR_ENV environment variable to point at a local copy of the models;
+    None means easyocr's default location (~/.EasyOCR/model).
+    """
+    return os.environ.get(OCR_MODEL_DIR_ENV) or None
+
+
+def get_reader():
+    """
+    Return the shared easyocr Reader, creating it on the first call.
+    
+    easyocr (and torch) are only imported here, so starting the app does not load them.
+    The weights are read from get_model_directory() with downloads disabled, and the GPU is
+    only requested when torch can actually see one. Safe to call from worker threads.
+    
+    Raises:
+        FileNotFoundError: If the model weights are not in the model directory
+    """
+    global _reader
+    with _reader_lock:
+        if _reader is None:
+            import easyocr
+            import torch
+            
+            model_directory = get_model_directory()
+            try:
+                _reader = easyocr.Reader(
+                    OCR_LANGUAGES,
+                    gpu=torch.cuda.is_available(),
+                    model_storage_directory=model_directory,
+                    download_enabled=False,
+                    verbose=False
+                )
+            except FileNotFoundError as e:
+                location = model_directory or "the default easyocr model directory"
+                raise FileNotFoundError(
+                    f"OCR model files not found in {location} ({e}). "
+                    f"Set {OCR_MODEL_DIR_ENV} to a directory containing the easyocr models."
+                ) from e
+        return _reader
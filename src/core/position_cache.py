@@ -0,0 +1,74 @@
+import threading
+from collections import OrderedDict
+from typing import Any
+
+
+class PositionResultCache:
+    """
+    Bounded LRU cache of calculation results for individual kernel positions.
+    
+    Entries are keyed by (position, input version, kernel version, constant, filter type,
+    filter selection, border mode), so any model edit or setting change makes older entries unreachable.
+    Because model versions only increase, entries from older versions are dropped as soon
+    as a newer version is seen instead of waiting to be evicted.
+    
+    The cache is shared with the playback lookahead thread, so every operation holds a lock,
+    and results computed for versions older than the ones held are discarded rather than
+    evicting the newer entries.
+    """
+    def __init__(self, max_entries: int):
+        self._max_entries = max_entries
+        self._entries = OrderedDict()
+        # (input version, kernel version) of the entries currently held
+        self._model_versions = None
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def make_key(position: tuple[int, int], input_version: int, kernel_version: int,
+                 constant: float, filter_type: str, filter_selection: str, border_mode: str) -> tuple:
+        return (position, input_version, kernel_version, constant, filter_type, filter_selection, border_mode)
+    
+    def get(self, key: tuple) -> dict[str, Any] | None:
+        with self._lock:
+            self._drop_stale_entries(key)
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+            return result
+    
+    def put(self, key: tuple, result: dict[str, Any]) -> None:
+        with self._lock:
+            if self._is_outdated(key):
+                return
+            self._drop_stale_entries(key)
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._model_versions = None
+    
+    def __contains__(self, key: tuple) -> bool:
+        with self._lock:
+            return key in self._entries
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+    
+    def _is_outdated(self, key: tuple) -> bool:
+        # A result for an older input or kernel version than the entries held (e.g. finished by
+        # the lookahead thread after an edit) can never be requested again
+        if self._model_versions is None:
+            return False
+        input_version, kernel_version = key[1:3]
+        return input_version < self._model_versions[0] or kernel_version < self._model_versions[1]
+    
+    def _drop_stale_entries(self, key: tuple) -> None:
+        model_versions = key[1:3]
+        if model_versions != self._model_versions:
+            self._entries.clear()
+            self._model_versions = model_versions
@@ -0,0 +1,41 @@
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+
+class ImportWorkerSignals(QObject):
+    # Signal emitted after each batch of rows is read, passes rows done and total rows
+    progress = Signal(int, int)
+    # Signal emitted when processing ends without being cancelled, passes process_image()'s result
+    finished = Signal(bool, object, str)
+
+
+class ImportWorker(QRunnable):
+    """
+    Runs GridImageProcessor.process_image() on a pool thread so the window stays responsive.
+    
+    Signals are delivered to the GUI thread through queued connections. A cancelled worker
+    stops between OCR batches and never emits finished, so a superseded import cannot
+    overwrite the grid.
+    """
+    def __init__(self, processor, file_path: str):
+        super().__init__()
+        self.signals = ImportWorkerSignals()
+        self._processor = processor
+        self._file_path = file_path
+        self._cancelled = False
+    
+    def run(self) -> None:
+        result = self._processor.process_image(
+            self._file_path, progress=self._on_progress, is_cancelled=self.is_cancelled
+        )
+        if not self._cancelled:
+            self.signals.finished.emit(*result)
+    
+    def cancel(self) -> None:
+        self._cancelled = True
+    
+    def is_cancelled(self) -> bool:
+        return self._cancelled
+    
+    def _on_progress(self, rows_done: int, total_rows: int) -> None:
+        if not self._cancelled:
+            self.signals.progress.emit(rows_done, total_rows)
@@ -1,8 +1,11 @@
-from PySide6.QtWidgets import QFrame, QVBoxLayout, QWidget, QPushButton, QFileDialog, QMessageBox
-from PySide6.QtCore import Qt, Signal
+from functools import partial
+from PySide6.QtWidgets import QFrame, QVBoxLayout, QHBoxLayout, QWidget, QPushButton, QFileDialog, QMessageBox, QProgressBar
+from PySide6.QtCore import Qt, Signal, QThreadPool
 from ui.common import PixelGridWidget, TitleBarWidget
 from core.grid_image_processor import GridImageProcessor
+from core.ocr_cache import OcrResultCache
 from consts import MIN_GRID_SIZE, MAX_GRID_SIZE
+from .import_worker import ImportWorker
 
 class InputImageWidget(QFrame):
     grid_size_detected = Signal(int)
@@ -18,7 +21,11 @@ class InputImageWidget(QFrame):
         # Initialize pixel grid widget reference
         self._pixel_grid = None
         # Initialize image processor
-        self._processor = GridImageProcessor()
+        self._processor = GridImageProcessor(cache=OcrResultCache())
+        # Image imports run on a single background thread; only the latest one may apply its result
+        self._import_pool = QThreadPool()
+        self._import_pool.setMaxThreadCount(1)
+        self._import_worker = None
         self._setup_ui()
         
         # Connect to coordinator signals if coordinator is provided
@@ -57,6 +64,19 @@ class InputImageWidget(QFrame):
         self._pixel_grid = PixelGridWidget(self._model, editable=True)
         content_layout.addWidget(self._pixel_grid)
         
+        # Create the import progress row (progress bar and cancel button), shown only while an image is being read
+        self._import_progress = QWidget()
+        import_progress_layout = QHBoxLayout(self._import_progress)
+        import_progress_layout.setContentsMargins(0, 0, 0, 0)
+        self._import_progress_bar = QProgressBar()
+        self._import_progress_bar.setFormat("Reading rows %v/%m")
+        import_progress_layout.addWidget(self._import_progress_bar, 1)
+        cancel_button = QPushButton("Cancel")
+        cancel_button.clicked.connect(self.cancel_import)
+        import_progress_layout.addWidget(cancel_button)
+        self._import_progress.setVisible(False)
+        content_layout.addWidget(self._import_progress)
+        
         # Add both the title bar and content area to the main layout
         main_layout.addWidget(title_bar) # Title bar at the top
         main_layout.addWidget(content_area, 1) # Content area below with stretch factor 1
@@ -119,8 +139,33 @@ class InputImageWidget(QFrame):
         if not file_path:
             return
         
-        # Process the selected image using the GridImageProcessor
-        success, result, message = self._processor.process_image(file_path)
+        # Process the selected image on the worker thread, replacing any import still in progress
+        self.cancel_import()
+        worker = ImportWorker(self._processor, file_path)
+        worker.signals.progress.connect(self._on_import_progress)
+        worker.signals.finished.connect(partial(self._on_import_finished, worker))
+        self._import_worker = worker
+        self._import_progress_bar.setRange(0, 0)  # Busy indicator until the grid size is known
+        self._import_progress.setVisible(True)
+        self._import_pool.start(worker)
+    
+    def cancel_import(self) -> None:
+        # Cancel the in-flight import (it stops after its current OCR batch and is never applied)
+        if self._import_worker is not None:
+            self._import_worker.cancel()
+            self._import_worker = None
+        self._import_progress.setVisible(False)
+    
+    def _on_import_progress(self, rows_done: int, total_rows: int) -> None:
+        self._import_progress_bar.setRange(0, total_rows)
+        self._import_progress_bar.setValue(rows_done)
+    
+    def _on_import_finished(self, worker: ImportWorker, success: bool, result, message: str) -> None:
+        # Ignore results of imports that were cancelled or replaced after they finished
+        if worker is not self._import_worker or worker.is_cancelled():
+            return
+        self._import_worker = None
+        self._import_progress.setVisible(False)
         
         # Show error if processing failed
         if not success:
@@ -140,28 +185,27 @@ class InputImageWidget(QFrame):
             self.show_error(f"Grid size {grid_size}x{grid_size} is outside valid range ({MIN_GRID_SIZE}-{MAX_GRID_SIZE})")
             return
         
-        # Update the model with the detected grid size
-        self._model.set_grid_size(grid_size)
-        
-        # Update the control panel grid size input to match detected size
-        if self._control_panel:
-            # Block signals to prevent triggering grid_size_changed signal while updating
-            self._control_panel.grid_size_input.spinbox.blockSignals(True)
-            try:
-                # Set the spinbox value to the detected grid size
-                self._control_panel.grid_size_input.set_value(grid_size)
-            finally:
-                # Always restore signal handling, even if an error occurs
-                self._control_panel.grid_size_input.spinbox.blockSignals(False)
-        
-        # Emit signal to notify other components of the detected grid size
-        self.grid_size_detected.emit(grid_size)
-        
-        # Populate the grid with extracted cell values
-        for row_idx, row_data in enumerate(grid_data):
-            for col_idx, cell_value in enumerate(row_data):
-                # Set each cell value in the model
-                self._model.set_cell(row_idx, col_idx, cell_value)
+        # Resize and populate the model in one batch so listeners see a single update
+        with self._model.batch():
+            # Update the model with the detected grid size
+            self._model.set_grid_size(grid_size)
+            
+            # Update the control panel grid size input to match detected size
+            if self._control_panel:
+                # Block signals to prevent triggering grid_size_changed signal while updating
+                self._control_panel.grid_size_input.spinbox.blockSignals(True)
+                try:
+                    # Set the spinbox value to the detected grid size
+                    self._control_panel.grid_size_input.set_value(grid_size)
+                finally:
+                    # Always restore signal handling, even if an error occurs
+                    self._control_panel.grid_size_input.spinbox.blockSignals(False)
+            
+            # Emit signal to notify other components of the detected grid size
+            self.grid_size_detected.emit(grid_size)
+            
+            # Populate the grid with extracted cell values
+            self._model.set_region(0, 0, grid_data)
         
         # Show success message if there's any message to display
         if message:
@@ -9,6 +9,7 @@ from ui.common.number_input import NumberInputWidget
 from ui.common.dropdown import DropdownWidget
 from ui.common.title_bar_widget import TitleBarWidget
 from utils.latex_renderer import render_latex_to_pixmap
+from utils.kernel_utils import gaussian_kernel
 from consts import (
     DEFAULT_KERNEL_SIZE, MIN_KERNEL_SIZE, MAX_KERNEL_SIZE,
     DEFAULT_CONSTANT_MULTIPLIER, MIN_CONSTANT_MULTIPLIER, MAX_CONSTANT_MULTIPLIER,
@@ -132,10 +133,12 @@ class KernelConfigWidget(QFrame):
     def _apply_identity_preset(self) -> None:
         size = self._kernel_model.get_grid_size()
         center = size // 2
-        for row in range(size):
-            for col in range(size):
-                value = 1.0 if (row == center and col == center) else 0.0
-                self._kernel_model.set_cell(row, col, value)
+        # Write the whole preset with a single model update
+        with self._kernel_model.batch():
+            for row in range(size):
+                for col in range(size):
+                    value = 1.0 if (row == center and col == center) else 0.0
+                    self._kernel_model.set_cell(row, col, value)
     
     def set_filter(self, filter_name: str) -> None:
         if filter_name == "Mean":
@@ -188,16 +191,18 @@ class KernelConfigWidget(QFrame):
         middle_row = size // 2
         left_col = 0
         
-        self._kernel_model.set_all_values(0.0)
-        self._kernel_model.set_cell(middle_row, left_col, 1.0)
+        with self._kernel_model.batch():
+            self._kernel_model.set_all_values(0.0)
+            self._kernel_model.set_cell(middle_row, left_col, 1.0)
     
     def _apply_shift_right_profile(self) -> None:
         size = self._kernel_model.get_grid_size()
         middle_row = size // 2
         right_col = size - 1
         
-        self._kernel_model.set_all_values(0.0)
-        self._kernel_model.set_cell(middle_row, right_col, 1.0)
+        with self._kernel_model.batch():
+            self._kernel_model.set_all_values(0.0)
+            self._kernel_model.set_cell(middle_row, right_col, 1.0)
     
     def set_sigma(self, sigma: float) -> None:
         self._sigma = sigma
@@ -213,30 +218,6 @@ class KernelConfigWidget(QFrame):
         self.gaussian_formula_label.setPixmap(pixmap)
     
     def _apply_gaussian_kernel(self) -> None:
-        import math
-        
+        # Kernels are memoized per (size, sigma, normalize) and installed with a single model update
         size = self._kernel_model.get_grid_size()
-        center = size // 2
-        sigma_squared = self._sigma * self._sigma
-        coefficient = 1.0 / (2.0 * math.pi * sigma_squared)
-        
-        kernel_sum = 0.0
-        temp_values = []
-        
-        for row in range(size):
-            row_values = []
-            for col in range(size):
-                x = col - center
-                y = row - center
-                exponent = -(x * x + y * y) / (2.0 * sigma_squared)
-                value = coefficient * math.exp(exponent)
-                row_values.append(value)
-                kernel_sum += value
-            temp_values.append(row_values)
-        
-        for row in range(size):
-            for col in range(size):
-                value = temp_values[row][col]
-                if self._normalize and kernel_sum > 0:
-                    value = value / kernel_sum
-                self._kernel_model.set_cell(row, col, value)
\ No newline at end of file
+        self._kernel_model.set_array(gaussian_kernel(size, self._sigma, self._normalize))
@@ -1,6 +1,7 @@
 from PySide6.QtWidgets import QFrame, QVBoxLayout, QWidget
 from PySide6.QtCore import Qt
 from ui.common import PixelGridWidget, TitleBarWidget
+from core import ApplicationState
 
 class OutputImageWidget(QFrame):
     def __init__(self, model, coordinator=None):
@@ -43,6 +44,8 @@ class OutputImageWidget(QFrame):
         
         # Create the read-only pixel grid widget for displaying the output image
         self._pixel_grid = PixelGridWidget(self._model, editable=False)
+        # Clicking an output cell moves the kernel there to explain how it was computed
+        self._pixel_grid.cell_clicked.connect(self._on_cell_clicked)
         content_layout.addWidget(self._pixel_grid)
         
         # Add both the title bar and content area to the main layout
@@ -57,6 +60,14 @@ class OutputImageWidget(QFrame):
             # Draw a border around this cell to show where output is being written
             self._pixel_grid.set_bordered_cell(output_cell)
     
+    def _on_cell_clicked(self, row: int, col: int) -> None:
+        # Jump to the clicked output cell during navigation (ignored for cells the kernel never visits)
+        if self._coordinator and self._coordinator.get_state() == ApplicationState.NAVIGATING:
+            try:
+                self._coordinator.seek(row, col)
+            except IndexError:
+                pass
+    
     def _on_state_changed(self, state) -> None:
         # Update display when the application state changes
         if self._pixel_grid:
@@ -1,6 +1,7 @@
 from PySide6.QtWidgets import QWidget
 from PySide6.QtCore import Qt, QSize
 from PySide6.QtGui import QPainter, QPen, QColor, QFont, QFontMetrics
+from core.filter_calculators.calculation_record import CalculationRecord
 
 
 class CalculationTableWidget(QWidget):
@@ -19,7 +20,7 @@ class CalculationTableWidget(QWidget):
         # Set minimum height based on number of rows
         self.setMinimumHeight(self._row_count * self._cell_height)
     
-    def set_calculations(self, calculations: list) -> None:
+    def set_calculations(self, calculations: list[CalculationRecord]) -> None:
         # Update the calculation data and recalculate widget dimensions
         self._calculations = calculations
         if self._calculations:
@@ -75,15 +76,8 @@ class CalculationTableWidget(QWidget):
         for calc in self._calculations:
             max_width = 0
             
-            # Collect all text that will appear in this column
-            texts = [
-                str(calc['index']),  # Row 0: Cell index
-                f"({calc['coordinate'][0]},{calc['coordinate'][1]})",  # Row 1: Coordinates
-                str(calc['input_value']),  # Row 2: Input pixel value
-                f"{calc['input_value']}×{calc['final_kernel_value']:.2f}",  # Row 3: Calculation expression
-                f"{calc['result']:.2f}",  # Row 4: Raw result
-                f"{calc['bounded_result']:.2f}"  # Row 5: Bounded result
-            ]
+            # Collect all text that will appear in this column (formatted once per record)
+            texts = calc.display_texts()
             
             # Find the widest text in this column
             for text in texts:
@@ -173,8 +167,9 @@ class CalculationTableWidget(QWidget):
         # Draw data columns (one per affected cell)
         x_offset = self._label_width
         for col_idx, calc in enumerate(self._calculations):
-            # Get the width for this column
+            # Get the width and text for this column
             cell_width = actual_cell_widths[col_idx]
+            texts = calc.display_texts()
             
             # Draw all rows in this column
             for row_idx in range(self._row_count):
@@ -190,25 +185,9 @@ class CalculationTableWidget(QWidget):
                 else:
                     painter.setPen(QPen(data_text_color))
                 
-                # Select appropriate text based on row
-                if row_idx == 0:
-                    # Row 0: Cell index (header)
-                    text = str(calc['index'])
-                elif row_idx == 1:
-                    # Row 1: Grid coordinates
-                    text = f"({calc['coordinate'][0]},{calc['coordinate'][1]})"
-                elif row_idx == 2:
-                    # Row 2: Input pixel value
-                    text = str(calc['input_value'])
-                elif row_idx == 3:
-                    # Row 3: Calculation expression (input × kernel weight)
-                    text = f"{calc['input_value']}×{calc['final_kernel_value']:.2f}"
-                elif row_idx == 4:
-                    # Row 4: Raw calculation result
-                    text = f"{calc['result']:.2f}"
-                else:
-                    # Row 5: Bounded result (clamped to [0, 255])
-                    text = f"{calc['bounded_result']:.2f}"
+                # Row 0: cell index (header), 1: coordinates, 2: input value, 3: calculation
+                # expression, 4: raw result, 5: bounded result (clamped to [0, 255])
+                text = texts[row_idx]
                 
                 # Draw text centered in the cell
                 painter.drawText(x_offset, y, cell_width, self._cell_height,
@@ -0,0 +1,51 @@
+from PySide6.QtCore import QRunnable
+
+
+class LookaheadWorker(QRunnable):
+    """
+    Computes the results of upcoming kernel positions on a pool thread and stores them in
+    the shared PositionResultCache, so playback ticks only publish precomputed results.
+    
+    Each job is a (position, cache key) pair built on the GUI thread. calculate still reads
+    the live models and coordinator (border mode, window, grid values), so is_current(position,
+    key) is checked before and after every calculation and a result is only stored while the
+    current settings still produce its key. Once they do not, the job stops: the remaining
+    positions are calculated on demand by the GUI thread.
+    """
+    def __init__(self, calculate, jobs: list[tuple[tuple[int, int], tuple]], result_cache, is_current):
+        super().__init__()
+        self._calculate = calculate
+        self._jobs = jobs
+        self._result_cache = result_cache
+        self._is_current = is_current
+        self._cancelled = False
+        self._finished = False
+    
+    def run(self) -> None:
+        try:
+            for position, key in self._jobs:
+                if self._cancelled or not self._is_current(position, key):
+                    return
+                # The GUI thread may have reached this position first
+                if key in self._result_cache:
+                    continue
+                try:
+                    result = self._calculate(position=position)
+                except (IndexError, ValueError):
+                    # Expected only when the models changed shape under the job (e.g. the grid
+                    # was resized); with unchanged settings it is a real error
+                    if self._is_current(position, key):
+                        raise
+                    return
+                if not self._is_current(position, key):
+                    return
+                self._result_cache.put(key, result)
+        finally:
+            self._finished = True
+    
+    def cancel(self) -> None:
+        # Stop after the position currently being computed
+        self._cancelled = True
+    
+    def is_finished(self) -> bool:
+        return self._finished
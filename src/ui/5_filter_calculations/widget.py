@@ -1,12 +1,18 @@
+import math
+import numpy as np
+from functools import partial
+from itertools import islice
 from PySide6.QtWidgets import QFrame, QVBoxLayout, QLabel, QScrollArea, QWidget
-from PySide6.QtCore import Qt
-from core import ApplicationState
+from PySide6.QtCore import Qt, QThreadPool
+from core import ApplicationState, PositionResultCache
 from core.filter_calculators.mean_filter import MeanFilterCalculator
 from core.filter_calculators.custom_filter import CustomFilterCalculator
 from core.filter_calculators.gaussian_filter import GaussianFilterCalculator
 from core.filter_calculators.median_filter import MedianFilterCalculator
 from .calculation_table_widget import CalculationTableWidget
+from .lookahead_worker import LookaheadWorker
 from ui.common.title_bar_widget import TitleBarWidget
+from consts import POSITION_CACHE_MAX_ENTRIES, PLAYBACK_LOOKAHEAD_POSITIONS
 
 
 class FilterCalculationsWidget(QFrame):
@@ -31,6 +37,13 @@ class FilterCalculationsWidget(QFrame):
         
         # Create the calculator that performs the convolution computation
         self._calculator = MeanFilterCalculator(input_model, kernel_model, coordinator)
+        # Cache of per-position results so scrubbing back to a visited position skips recomputation
+        self._result_cache = PositionResultCache(POSITION_CACHE_MAX_ENTRIES)
+        # While playing, upcoming positions are computed on a single background thread
+        self._lookahead_enabled = False
+        self._lookahead_pool = QThreadPool()
+        self._lookahead_pool.setMaxThreadCount(1)
+        self._lookahead_worker = None
         
         self._setup_ui()
     
@@ -139,11 +152,20 @@ class FilterCalculationsWidget(QFrame):
         # Recalculate and update the display with the new constant
         self._update_display()
     
+    def set_lookahead_enabled(self, enabled: bool) -> None:
+        # Compute the next positions in the background while playback is running
+        self._lookahead_enabled = enabled
+        if enabled:
+            self._schedule_lookahead()
+        else:
+            self._cancel_lookahead()
+    
     def on_state_changed(self, state) -> None:
         # Handle application state changes
         if state == ApplicationState.INITIAL:
             # Show placeholder when returning to initial state
             self._show_placeholder()
+            self._cancel_lookahead()
         elif state == ApplicationState.NAVIGATING:
             # Show content and perform calculations when entering navigation state
             self._show_content()
@@ -153,30 +175,172 @@ class FilterCalculationsWidget(QFrame):
         # Update calculations when the kernel position changes during navigation
         if self._coordinator.get_state() == ApplicationState.NAVIGATING:
             self._update_display()
+            self._schedule_lookahead()
     
     def on_kernel_changed(self, size: int, grid_data: list) -> None:
         # Update calculations when the kernel data or size changes
         if self._coordinator.get_state() == ApplicationState.NAVIGATING:
             self._update_display()
     
-    def _update_display(self):
-        # Perform calculation and update all display components
-        # Only update if in NAVIGATING state
+    def recompute_input_region(self, top: int, left: int, bottom: int, right: int) -> None:
+        # Refresh only the already-computed output cells whose windows overlap the edited input rectangle
         if self._coordinator.get_state() != ApplicationState.NAVIGATING:
             return
         
-        # Perform the calculation for the current kernel position
+        size = self._input_model.get_grid_size()
+        if self._output_model.get_grid_size() != size:
+            return
+        
+        # Any output cell within k of the edit sees the changed pixels in its window
+        k = self._kernel_model.get_grid_size() // 2
+        top, left, bottom, right = top - k, left - k, bottom + k, right + k
+        # With wrap-around borders, windows near one edge also read the opposite edge
+        if self._coordinator.get_border_mode() == "Wrap":
+            if top < 0 or bottom > size:
+                top, bottom = 0, size
+            if left < 0 or right > size:
+                left, right = 0, size
+        top, left = max(0, top), max(0, left)
+        bottom, right = min(size, bottom), min(size, right)
+        
+        filter_type = self._filter_type if self._filter_selection == "Custom" else "Cross-Correlation"
+        region_output = self._calculator.apply_region(self._constant, filter_type, top, left, bottom, right)
+        
+        # Build the refreshed block so it is written back with a single model update
+        output_block = []
+        for row in range(top, bottom):
+            block_row = []
+            for col in range(left, right):
+                output_value = self._output_model.get_value(row, col)
+                value = region_output[row - top][col - left]
+                # Cells the kernel has not visited yet stay empty until navigation reaches them
+                if output_value is not None and not math.isnan(value):
+                    output_value = max(0, min(255, round(float(value))))
+                block_row.append(output_value)
+            output_block.append(block_row)
+        self._output_model.set_region(top, left, output_block)
+        
+        # Refresh the step-by-step table for the current position
+        self._update_display()
+    
+    def compute_all(self) -> None:
+        """
+        Fill the whole output grid with the whole-image engine and install it in one update.
+        
+        Navigation starts if needed, so the step-by-step explanation stays available for
+        any position the user then selects.
+        """
+        if self._output_model.get_grid_size() != self._input_model.get_grid_size():
+            return
+        if self._coordinator.get_state() == ApplicationState.INITIAL:
+            self._coordinator.start()
+        
+        filter_type = self._filter_type if self._filter_selection == "Custom" else "Cross-Correlation"
+        output = self._calculator.apply_full(self._constant, filter_type)
+        # Cells the kernel never visits ("Valid Only" borders) stay empty
+        mask = np.isnan(output)
+        values = np.clip(np.rint(np.nan_to_num(output, nan=0.0)), 0, 255)
+        self._output_model.set_array(values, mask)
+    
+    def fill_positions(self, start: int, stop: int) -> None:
+        # Write the outputs of the positions [start, stop) (linear indices) in one vectorized pass
+        # and one model update, for positions stepped over without being displayed
+        if self._coordinator.get_state() != ApplicationState.NAVIGATING or start >= stop:
+            return
+        if self._output_model.get_grid_size() != self._input_model.get_grid_size():
+            return
+        
+        first_row, first_col = self._coordinator.position_at(start)
+        last_row, last_col = self._coordinator.position_at(stop - 1)
+        left = self._coordinator.position_at(0)[1]
+        right = self._coordinator.position_at(self._coordinator.position_count() - 1)[1] + 1
+        top, bottom = first_row, last_row + 1
+        
+        filter_type = self._filter_type if self._filter_selection == "Custom" else "Cross-Correlation"
+        region_output = self._calculator.apply_region(self._constant, filter_type, top, left, bottom, right)
+        
+        # Only the cells inside the index range change; the rest of the block keeps its current values
+        values = np.array(self._output_model.get_array()[top:bottom, left:right])
+        mask = np.array(self._output_model.get_mask()[top:bottom, left:right])
+        selected = ~np.isnan(region_output)
+        selected[0, :first_col - left] = False
+        selected[-1, last_col - left + 1:] = False
+        values[selected] = np.clip(np.rint(region_output[selected]), 0, 255)
+        mask[selected] = False
+        self._output_model.set_region(top, left, values, mask)
+    
+    def _calculate(self, position: tuple[int, int] | None = None):
+        # Perform the calculation for the current kernel position (or the given one)
         if self._filter_selection == "Mean":
-            result = self._calculator.calculate(self._constant)
+            return self._calculator.calculate(self._constant, position=position)
         elif self._filter_selection == "Gaussian":
-            result = self._calculator.calculate(self._constant)
+            return self._calculator.calculate(self._constant, position=position)
         elif self._filter_selection == "Custom":
-            result = self._calculator.calculate(self._constant, self._filter_type)
+            return self._calculator.calculate(self._constant, self._filter_type, position)
         elif self._filter_selection == "Median":
-            result = self._calculator.calculate(self._constant)
-        else:
+            return self._calculator.calculate(self._constant, position=position)
+        return None
+    
+    def _make_cache_key(self, position: tuple[int, int]) -> tuple:
+        return PositionResultCache.make_key(
+            position,
+            self._input_model.get_version(),
+            self._kernel_model.get_version(),
+            self._constant,
+            self._filter_type,
+            self._filter_selection,
+            self._coordinator.get_border_mode()
+        )
+    
+    def _is_current_key(self, position: tuple[int, int], key: tuple) -> bool:
+        # Called from the lookahead thread: whether the current models and settings still produce key
+        return self._make_cache_key(position) == key
+    
+    def _schedule_lookahead(self) -> None:
+        # Queue the next positions that are not cached yet, keeping a single job in flight
+        if not self._lookahead_enabled or self._coordinator.get_state() != ApplicationState.NAVIGATING:
+            return
+        if self._lookahead_worker is not None and not self._lookahead_worker.is_finished():
+            return
+        if self._filter_selection not in ("Mean", "Gaussian", "Custom", "Median"):
+            return
+        
+        upcoming = islice(
+            self._coordinator.iter_positions(self._coordinator.get_position_index() + 1),
+            PLAYBACK_LOOKAHEAD_POSITIONS
+        )
+        jobs = [(position, self._make_cache_key(position)) for position in upcoming]
+        jobs = [(position, key) for position, key in jobs if key not in self._result_cache]
+        if not jobs:
             return
         
+        # Bind the current calculator and settings; the rest of the state the calculation reads
+        # (models, border mode) is checked against each key by _is_current_key
+        filter_type = self._filter_type if self._filter_selection == "Custom" else "Cross-Correlation"
+        calculate = partial(self._calculator.calculate, self._constant, filter_type)
+        self._lookahead_worker = LookaheadWorker(calculate, jobs, self._result_cache, self._is_current_key)
+        self._lookahead_pool.start(self._lookahead_worker)
+    
+    def _cancel_lookahead(self) -> None:
+        if self._lookahead_worker is not None:
+            self._lookahead_worker.cancel()
+            self._lookahead_worker = None
+    
+    def _update_display(self):
+        # Perform calculation and update all display components
+        # Only update if in NAVIGATING state
+        if self._coordinator.get_state() != ApplicationState.NAVIGATING:
+            return
+        
+        # Reuse the result if this position was already calculated with the same models and settings
+        cache_key = self._make_cache_key(self._coordinator.get_output_cell())
+        result = self._result_cache.get(cache_key)
+        if result is None:
+            result = self._calculate()
+            if result is None:
+                return
+            self._result_cache.put(cache_key, result)
+        
         # Update the calculation table with step-by-step computation details
         self._table_widget.set_calculations(result['calculations'])
         # Update scroll area height to match table height (remove wasted space)
@@ -197,7 +361,7 @@ class FilterCalculationsWidget(QFrame):
         else:
             # Build text for displaying the sum of all weighted pixel values
             calculations = result['calculations']
-            sum_parts = " + ".join([f"{c['bounded_result']:.2f}" for c in calculations])
+            sum_parts = " + ".join([c.display_texts()[5] for c in calculations])
             sum_text = f"Sum: {sum_parts} = {result['total_sum']:.2f}"
             
             if self._filter_selection == "Mean":
@@ -1,24 +1,48 @@
+import time
 from PySide6.QtCore import QTimer, QObject, Signal
 from typing import Optional
+from consts import TURBO_FRAME_RATE, TURBO_FRAME_BUDGET
 
 
 class PlaybackController(QObject):
+    """
+    Advances the kernel on a timer.
+    
+    At normal speed every tick moves one position. In turbo mode the timer fires at
+    TURBO_FRAME_RATE and each tick advances as many positions as fit in TURBO_FRAME_BUDGET
+    of a frame (adjusted from the time the previous tick took), so the widgets repaint at
+    most once per frame while the outputs of skipped positions are filled in bulk.
+    """
     playback_state_changed = Signal(bool)
     
     def __init__(self, coordinator, speed_input):
         super().__init__()
         self._coordinator = coordinator
         self._speed_input = speed_input
+        self._turbo = False
+        # Positions advanced per turbo frame, adapted to the measured cost of a frame
+        self._positions_per_frame = 1
         self._play_timer = QTimer()
         self._play_timer.setSingleShot(False)
         self._play_timer.timeout.connect(self._on_timer_timeout)
         self._update_interval()
     
     def _update_interval(self) -> None:
+        if self._turbo:
+            self._play_timer.setInterval(int(1000 / TURBO_FRAME_RATE))
+            return
         speed = self._speed_input.value()
         interval_ms = int(speed * 1000)
         self._play_timer.setInterval(interval_ms)
     
+    def set_turbo(self, enabled: bool) -> None:
+        self._turbo = enabled
+        self._positions_per_frame = 1
+        self.update_speed()
+    
+    def is_turbo(self) -> bool:
+        return self._turbo
+    
     def start(self) -> None:
         if not self._coordinator:
             return
@@ -54,7 +78,19 @@ class PlaybackController(QObject):
             self.stop()
             return
         
-        if self._coordinator.can_go_next():
-            self._coordinator.next()
-        else:
+        if not self._coordinator.can_go_next():
             self.stop()
+        elif self._turbo:
+            self._advance_turbo_frame()
+        else:
+            self._coordinator.next()
+    
+    def _advance_turbo_frame(self) -> None:
+        start_time = time.perf_counter()
+        self._coordinator.advance(self._positions_per_frame)
+        elapsed = time.perf_counter() - start_time
+        
+        # Scale the step towards the frame budget, at most doubling or halving per frame
+        budget = TURBO_FRAME_BUDGET / TURBO_FRAME_RATE
+        scale = budget / elapsed if elapsed > 0 else 2.0
+        self._positions_per_frame = max(1, int(self._positions_per_frame * min(2.0, max(0.5, scale))))
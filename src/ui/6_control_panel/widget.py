@@ -1,12 +1,13 @@
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QGroupBox, QPushButton, QHBoxLayout, QCheckBox, QGridLayout, QFrame
-from PySide6.QtCore import Signal
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QGroupBox, QPushButton, QHBoxLayout, QCheckBox, QGridLayout, QFrame, QSlider
+from PySide6.QtCore import Qt, Signal
 from .playback_controller import PlaybackController
 from consts import (
     DEFAULT_GRID_SIZE, MIN_GRID_SIZE, MAX_GRID_SIZE,
-    DEFAULT_INPUT_MODE, INPUT_MODES,
+    DEFAULT_INPUT_MODE, INPUT_MODES, DEFAULT_INCREMENTAL_UPDATES,
     DEFAULT_FILTER_PROFILE, FILTER_PROFILES,
     DEFAULT_FILTER_CATEGORY, FILTER_CATEGORIES,
     DEFAULT_FILTER_TYPE, FILTER_TYPES,
+    DEFAULT_BORDER_MODE, BORDER_MODES,
     DEFAULT_FILTER_SELECTION, FILTER_SELECTIONS_LINEAR, FILTER_SELECTIONS_NONLINEAR,
     DEFAULT_NONLINEAR_FILTER,
     PROFILE_FILTER_TYPE, PROFILE_FILTER_SELECTION,
@@ -22,6 +23,8 @@ class ControlPanelWidget(QFrame):
     grid_size_changed = Signal(int)
     # Signal emitted when the input mode changes, passes the mode as a string
     input_mode_changed = Signal(str)
+    # Signal emitted when the incremental updates checkbox state changes, passes the new state as a boolean
+    incremental_updates_changed = Signal(bool)
     # Signal emitted when the show pixel values checkbox state changes, passes the new state as a boolean
     show_pixel_values_changed = Signal(bool)
     # Signal emitted when the show colors checkbox state changes, passes the new state as a boolean
@@ -30,6 +33,8 @@ class ControlPanelWidget(QFrame):
     category_changed = Signal(str)
     # Signal emitted when the filter type changes, passes the type as a string
     type_changed = Signal(str)
+    # Signal emitted when the border mode changes, passes the mode as a string
+    border_mode_changed = Signal(str)
     # Signal emitted when the filter selection changes, passes the filter as a string
     filter_changed = Signal(str)
     # Signal emitted when the filter profile changes, passes the profile as a string
@@ -38,6 +43,11 @@ class ControlPanelWidget(QFrame):
     sigma_changed = Signal(float)
     # Signal emitted when the normalize checkbox state changes, passes the new state as a boolean
     normalize_changed = Signal(bool)
+    # Signal emitted when computing upcoming positions in the background becomes useful or not
+    # (step-by-step playback is running), passes the new state as a boolean
+    lookahead_enabled_changed = Signal(bool)
+    # Signal emitted when the Compute All button is clicked
+    compute_all_requested = Signal()
     
     def __init__(self, coordinator=None):
         super().__init__()
@@ -104,6 +114,11 @@ class ControlPanelWidget(QFrame):
         self.input_mode_dropdown.value_changed.connect(self.input_mode_changed.emit)
         input_image_layout.addWidget(self.input_mode_dropdown)
         
+        self.incremental_updates_checkbox = QCheckBox("Incremental Updates")
+        self.incremental_updates_checkbox.setChecked(DEFAULT_INCREMENTAL_UPDATES)
+        self.incremental_updates_checkbox.stateChanged.connect(self._on_incremental_updates_changed)
+        input_image_layout.addWidget(self.incremental_updates_checkbox)
+        
         input_image_group.setLayout(input_image_layout)
         content_layout.addWidget(input_image_group)
         
@@ -134,6 +149,14 @@ class ControlPanelWidget(QFrame):
         self.type_dropdown.value_changed.connect(self._on_type_changed)
         filter_layout.addWidget(self.type_dropdown)
         
+        self.border_mode_dropdown = DropdownWidget(
+            label="Border Mode:",
+            options=BORDER_MODES,
+            default_option=DEFAULT_BORDER_MODE
+        )
+        self.border_mode_dropdown.value_changed.connect(self.border_mode_changed.emit)
+        filter_layout.addWidget(self.border_mode_dropdown)
+        
         self.filter_dropdown = DropdownWidget(
             label="Filter Selection:",
             options=FILTER_SELECTIONS_LINEAR,
@@ -199,6 +222,25 @@ class ControlPanelWidget(QFrame):
         
         nav_layout.addLayout(nav_buttons_layout)
         
+        # Scrub slider over every kernel position (linear index) plus a shortcut to the last one
+        scrub_layout = QHBoxLayout()
+        
+        self.position_slider = QSlider(Qt.Orientation.Horizontal)
+        self.position_slider.setMinimum(0)
+        self.position_slider.valueChanged.connect(self._on_position_slider_changed)
+        scrub_layout.addWidget(self.position_slider, 1)
+        
+        self.end_button = QPushButton("End")
+        self.end_button.clicked.connect(self._on_end_clicked)
+        scrub_layout.addWidget(self.end_button)
+        
+        nav_layout.addLayout(scrub_layout)
+        
+        self.compute_all_button = QPushButton("Compute All")
+        self.compute_all_button.setToolTip("Fill the whole output image at once; click an output cell to see its calculation")
+        self.compute_all_button.clicked.connect(self._on_compute_all_clicked)
+        nav_layout.addWidget(self.compute_all_button)
+        
         self.speed_input = NumberInputWidget(
             label="Speed:",
             default_value=0.25,
@@ -211,6 +253,11 @@ class ControlPanelWidget(QFrame):
         self.speed_input.value_changed.connect(self._on_speed_changed)
         nav_layout.addWidget(self.speed_input)
         
+        self.turbo_checkbox = QCheckBox("Turbo Playback")
+        self.turbo_checkbox.setToolTip("Advance as many positions per frame as possible, repainting at most 60 times per second")
+        self.turbo_checkbox.stateChanged.connect(self._on_turbo_changed)
+        nav_layout.addWidget(self.turbo_checkbox)
+        
         self._playback_controller = PlaybackController(self._coordinator, self.speed_input)
         self._playback_controller.playback_state_changed.connect(self._on_playback_state_changed)
         nav_group.setLayout(nav_layout)
@@ -246,6 +293,22 @@ class ControlPanelWidget(QFrame):
         if self._coordinator:
             self._coordinator.next()
     
+    def _on_position_slider_changed(self, index: int) -> None:
+        # Jump straight to the scrubbed position (one position_changed emission); with no
+        # positions (e.g. Valid Only with a kernel larger than the grid) there is nothing to seek
+        if self._coordinator and 0 <= index < self._coordinator.position_count():
+            self._coordinator.seek(index)
+    
+    def _on_end_clicked(self) -> None:
+        # Jump to the last kernel position
+        if self._coordinator and self._coordinator.position_count() > 0:
+            self._coordinator.seek(self._coordinator.position_count() - 1)
+    
+    def _on_compute_all_clicked(self) -> None:
+        # Stop any animation; the whole output is installed in one step
+        self._playback_controller.stop()
+        self.compute_all_requested.emit()
+    
     def _on_play_clicked(self) -> None:
         self._playback_controller.start()
     
@@ -254,10 +317,17 @@ class ControlPanelWidget(QFrame):
         self._update_button_states()
     
     def _on_playback_state_changed(self, is_playing: bool) -> None:
+        # Turbo playback skips positions, so precomputing the next few would be wasted
+        self.lookahead_enabled_changed.emit(is_playing and not self._playback_controller.is_turbo())
         self._update_play_pause_buttons()
         if not is_playing:
             self._update_button_states()
     
+    def _on_incremental_updates_changed(self, state: int) -> None:
+        # Recompute only the affected output cells on input edits instead of resetting
+        is_checked = state == 2
+        self.incremental_updates_changed.emit(is_checked)
+    
     def _on_show_pixel_values_changed(self, state: int) -> None:
         # Show or hide the pixel values in the pixel grid
         is_checked = state == 2
@@ -351,15 +421,24 @@ class ControlPanelWidget(QFrame):
     def _on_speed_changed(self, speed: float) -> None:
         self._playback_controller.update_speed()
     
+    def _on_turbo_changed(self, state: int) -> None:
+        is_checked = state == 2
+        self._playback_controller.set_turbo(is_checked)
+        # The step interval does not apply while turbo playback sets the pace
+        self.speed_input.setEnabled(not is_checked)
+        self.lookahead_enabled_changed.emit(self._playback_controller.is_playing() and not is_checked)
+    
     def _on_state_changed(self, state) -> None:
         if self._playback_controller.is_playing():
             self._playback_controller.stop()
         self._update_button_visibility()
         self._update_button_states()
         self._update_play_pause_buttons()
+        self._update_position_slider()
     
     def _on_position_changed(self, row: int, col: int) -> None:
         self._update_button_states()
+        self._update_position_slider()
         if self._playback_controller.is_playing() and self._coordinator and not self._coordinator.can_go_next():
             self._playback_controller.stop()
             self._update_play_pause_buttons()
@@ -381,6 +460,8 @@ class ControlPanelWidget(QFrame):
         self.reset_button.setVisible(not is_initial)
         self.previous_button.setVisible(not is_initial)
         self.next_button.setVisible(not is_initial)
+        self.position_slider.setVisible(not is_initial)
+        self.end_button.setVisible(not is_initial)
         # Hide play/pause buttons from grid layout in INITIAL state
         if is_initial:
             self.play_button_navigating.setVisible(False)
@@ -442,3 +523,16 @@ class ControlPanelWidget(QFrame):
             
             # Disable play button if at the end (no next position available)
             self.play_button_navigating.setEnabled(can_go_next)
+            self.end_button.setEnabled(can_go_next)
+    
+    def _update_position_slider(self) -> None:
+        # Keep the slider range and value in sync with the coordinator without seeking back
+        if not self._coordinator:
+            return
+        
+        position_count = self._coordinator.position_count()
+        self.position_slider.blockSignals(True)
+        self.position_slider.setEnabled(position_count > 0)
+        self.position_slider.setMaximum(max(0, position_count - 1))
+        self.position_slider.setValue(self._coordinator.get_position_index() if position_count > 0 else 0)
+        self.position_slider.blockSignals(False)
@@ -1,10 +1,13 @@
 from PySide6.QtWidgets import QWidget
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QRect, Signal
 from PySide6.QtGui import QPainter, QPen, QColor, QMouseEvent
 from .number_input_modal import show_number_input_dialog
 
 
 class PixelGridWidget(QWidget):
+    # Signal emitted when a cell is clicked (editable or not), passes the cell's row and column
+    cell_clicked = Signal(int, int)
+    
     def __init__(self, model, editable=False):
         super().__init__()
 
@@ -35,17 +38,40 @@ class PixelGridWidget(QWidget):
         # Whether to show the pixel colors in the grid
         self._show_colors = True
 
-        # Connect to model's signal to update display when grid data changes
-        self._model.grid_changed.connect(self._on_grid_changed)
+        # Connect to model's signal to repaint only the modified cells when grid data changes
+        self._model.region_changed.connect(self._on_region_changed)
         
         # Enable mouse tracking to receive mouse move events even without button pressed
         self.setMouseTracking(True)
         # Set minimum widget size to ensure visibility
         self.setMinimumSize(100, 100)
     
-    def _on_grid_changed(self, size: int, grid_data: list[list[int]]) -> None:
-        # Trigger a repaint when the grid data changes
-        self.update()
+    def _on_region_changed(self, change) -> None:
+        # Repaint the whole widget when the grid was replaced or resized
+        if change.is_full_grid():
+            self.update()
+            return
+        if change.is_empty():
+            return
+        
+        # Otherwise repaint only the dirty rectangle, padded so thick highlight borders are redrawn too
+        cell_size, offset_x, offset_y = self._get_grid_geometry(change.size)
+        padding = max(self._highlight_border_width, self._border_width)
+        dirty_rect = QRect(
+            offset_x + change.left * cell_size - padding,
+            offset_y + change.top * cell_size - padding,
+            (change.right - change.left) * cell_size + 2 * padding,
+            (change.bottom - change.top) * cell_size + 2 * padding
+        )
+        self.update(dirty_rect)
+    
+    def _get_grid_geometry(self, grid_size: int) -> tuple[int, int, int]:
+        # Calculate cell size based on the smaller dimension to maintain square cells
+        cell_size = int(min(self.width(), self.height()) / grid_size)
+        # Calculate offsets to center the grid within the widget
+        offset_x = int((self.width() - (cell_size * grid_size)) / 2)
+        offset_y = int((self.height() - (cell_size * grid_size)) / 2)
+        return cell_size, offset_x, offset_y
     
     def set_highlighted_cells(self, cells: list[tuple[int, int]], color: QColor = None) -> None:
         # Set which cells to highlight (e.g., cells under the convolution kernel)
@@ -128,19 +154,20 @@ class PixelGridWidget(QWidget):
         return None
     
     def mousePressEvent(self, event: QMouseEvent):
-        # Handle mouse click events for editing cells
-        # Early return if grid is not editable
-        if not self._editable:
-            return
-        
+        # Handle mouse click events for selecting and editing cells
         # Convert click position to cell coordinates
         cell = self._get_cell_from_position(event.pos().x(), event.pos().y())
         if cell is None:
             return
+        self.cell_clicked.emit(cell[0], cell[1])
+        
+        # Early return if grid is not editable
+        if not self._editable:
+            return
         
         # Get the clicked cell's current value
         row, col = cell
-        current_value = self._model.get_grid_data()[row][col]
+        current_value = self._model.get_value(row, col)
         
         if self._edit_mode == "Toggle":
             # In Toggle mode: start drag operation and flip cell value between 0 and 255
@@ -184,7 +211,7 @@ class PixelGridWidget(QWidget):
         # Only toggle if we've moved to a different cell (avoid re-toggling same cell)
         if self._last_toggled_cell != (row, col):
             self._last_toggled_cell = (row, col)
-            current_value = self._model.get_grid_data()[row][col]
+            current_value = self._model.get_value(row, col)
             new_value = 0 if current_value != 0 else 255
             self._model.set_cell(row, col, new_value)
     
@@ -224,9 +251,18 @@ class PixelGridWidget(QWidget):
         border_pen.setWidth(1) # Set border line width to 1 pixel
         border_pen.setCosmetic(True) # Ensure border width remains constant regardless of transformations
         
+        # Only cells intersecting the area being repainted need to be drawn
+        first_row, last_row, first_col, last_col = 0, grid_size, 0, grid_size
+        if cell_size > 0:
+            exposed = event.rect()
+            first_row = max(0, (exposed.top() - offset_y) // cell_size - 1)
+            last_row = min(grid_size, (exposed.bottom() - offset_y) // cell_size + 2)
+            first_col = max(0, (exposed.left() - offset_x) // cell_size - 1)
+            last_col = min(grid_size, (exposed.right() - offset_x) // cell_size + 2)
+        
         # Draw all cells with their values as grayscale colors
-        for row in range(grid_size):
-            for col in range(grid_size):
+        for row in range(first_row, last_row):
+            for col in range(first_col, last_col):
                 # Calculate pixel position for current cell
                 x = offset_x + col * cell_size
                 y = offset_y + row * cell_size
@@ -261,7 +297,6 @@ class PixelGridWidget(QWidget):
                     font.setPixelSize(font_size)
                     painter.setFont(font)
                     
-                    from PySide6.QtCore import QRect
                     text_rect = QRect(x, y, cell_size, cell_size)
                     painter.drawText(text_rect, Qt.AlignmentFlag.AlignCenter, str(cell_value))
         
@@ -1,7 +1,7 @@
 from PySide6.QtWidgets import QMainWindow, QWidget, QHBoxLayout, QVBoxLayout, QScrollArea
 from PySide6.QtCore import Qt
-from core import ImageGridModel, KernelApplicationCoordinator, ApplicationState
-from consts import DEFAULT_GRID_SIZE, DEFAULT_KERNEL_SIZE
+from core import ImageGridModel, KernelApplicationCoordinator, ApplicationState, GridChange
+from consts import DEFAULT_GRID_SIZE, DEFAULT_KERNEL_SIZE, DEFAULT_INCREMENTAL_UPDATES
 from .main_window_signal_connector import MainWindowSignalConnector
 
 class MainWindow(QMainWindow):
@@ -30,6 +30,8 @@ class MainWindow(QMainWindow):
         self._output_model = ImageGridModel(DEFAULT_GRID_SIZE, initial_value=None)
         # Create the coordinator to manage kernel position and navigation state
         self._coordinator = KernelApplicationCoordinator(DEFAULT_GRID_SIZE, DEFAULT_KERNEL_SIZE)
+        # Recompute only the affected output cells on input edits instead of resetting navigation
+        self._incremental_updates = DEFAULT_INCREMENTAL_UPDATES
         
         # Set up the UI components and layout
         self._setup_ui()
@@ -167,4 +169,14 @@ class MainWindow(QMainWindow):
     
     def _on_config_changed(self, *args) -> None:
         if self._coordinator.get_state() == ApplicationState.NAVIGATING:
-            self._coordinator.reset()
\ No newline at end of file
+            self._coordinator.reset()
+    
+    def set_incremental_updates(self, enabled: bool) -> None:
+        self._incremental_updates = enabled
+    
+    def _on_input_region_changed(self, change: GridChange) -> None:
+        if (self._incremental_updates and not change.is_full_grid()
+                and self._coordinator.get_state() == ApplicationState.NAVIGATING):
+            self._filter_calculations.recompute_input_region(change.top, change.left, change.bottom, change.right)
+        else:
+            self._on_config_changed()
@@ -41,6 +41,9 @@ class MainWindowSignalConnector:
         self._main_window._kernel_config.kernel_size_input.value_changed.connect(
             self._main_window._coordinator.set_kernel_size
         )
+        self._main_window._control_panel.border_mode_changed.connect(
+            self._main_window._coordinator.set_border_mode
+        )
     
     def _connect_filter_signals(self) -> None:
         self._main_window._control_panel.filter_changed.connect(
@@ -90,10 +93,22 @@ class MainWindowSignalConnector:
         self._main_window._kernel_config.constant_input.value_changed.connect(
             self._main_window._filter_calculations.set_constant
         )
+        self._main_window._control_panel.lookahead_enabled_changed.connect(
+            self._main_window._filter_calculations.set_lookahead_enabled
+        )
+        self._main_window._coordinator.positions_skipped.connect(
+            self._main_window._filter_calculations.fill_positions
+        )
+        self._main_window._control_panel.compute_all_requested.connect(
+            self._main_window._filter_calculations.compute_all
+        )
     
     def _connect_config_change_signals(self) -> None:
-        self._main_window._input_model.grid_changed.connect(
-            self._main_window._on_config_changed
+        self._main_window._input_model.region_changed.connect(
+            self._main_window._on_input_region_changed
+        )
+        self._main_window._control_panel.incremental_updates_changed.connect(
+            self._main_window.set_incremental_updates
         )
         self._main_window._kernel_config.kernel_size_input.value_changed.connect(
             self._main_window._on_config_changed
@@ -0,0 +1,600 @@
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from consts import (
+    SEPARABLE_TOLERANCE, HISTOGRAM_MEDIAN_MIN_RADIUS, HISTOGRAM_MEDIAN_MIN_RADIUS_FLOAT,
+    FFT_KERNEL_SIZE_THRESHOLD, FFT_MAX_CLAMPED_WEIGHTS, MEDIAN_CHUNK_BYTES, HISTOGRAM_MEDIAN_BLOCK_COLS
+)
+
+
+def to_float_array(grid_data, mask: np.ndarray | None = None) -> np.ndarray:
+    """
+    Convert grid data (list of lists or array) to a float64 array for the vectorized engines.
+    
+    Cells that hold None, or are flagged in the optional mask, become NaN.
+    """
+    if mask is None:
+        return np.asarray(grid_data, dtype=np.float64)
+    data = np.array(grid_data, dtype=np.float64)
+    data[mask] = np.nan
+    return data
+
+
+def has_full_windows(data: np.ndarray, radius: int) -> bool:
+    """
+    Check whether at least one (2k+1)x(2k+1) window fits entirely inside the data.
+    """
+    size = 2 * radius + 1
+    return data.ndim == 2 and data.shape[0] >= size and data.shape[1] >= size
+
+
+def sliding_windows(data: np.ndarray, radius: int) -> np.ndarray:
+    """
+    Return a zero-copy view of every (2k+1)x(2k+1) window that fits inside the data.
+    
+    Args:
+        data: 2D input array
+        radius: Kernel radius k
+    
+    Returns:
+        Array of shape (rows - 2k, cols - 2k, 2k+1, 2k+1) where element [i, j] is the
+        window centered on data[i + k, j + k]
+    """
+    size = 2 * radius + 1
+    return sliding_window_view(data, (size, size))
+
+
+def bounded_weighted_sum(windows: np.ndarray, kernel, constant: float) -> np.ndarray:
+    """
+    Sum the per-tap products of every window with the kernel, clamping each term to [0, 255].
+    
+    This is the vectorized form of the loop in BaseFilterCalculator.calculate(). Each tap is
+    broadcast across all windows at once, and taps are accumulated in the same row-major
+    order as the affected cells, so every total is identical to the one the scalar loop
+    produces. Memory stays at one value per window however large the kernel is.
+    
+    Args:
+        windows: Window view as returned by sliding_windows()
+        kernel: (2k+1)x(2k+1) kernel weights
+        constant: Multiplier applied to every kernel weight
+    
+    Returns:
+        Array of bounded sums, one per window
+    """
+    final_kernel = np.asarray(kernel, dtype=np.float64) * constant
+    total_sums = np.zeros(windows.shape[:2])
+    for (kernel_row, kernel_col), final_kernel_value in np.ndenumerate(final_kernel):
+        total_sums += np.clip(windows[:, :, kernel_row, kernel_col] * final_kernel_value, 0, 255)
+    return total_sums
+
+
+def uniform_kernel_weight(kernel) -> float | None:
+    """
+    Return the shared weight of a kernel whose cells all hold the same value, or None otherwise.
+    """
+    kernel = np.asarray(kernel, dtype=np.float64)
+    if kernel.size == 0 or not np.all(kernel == kernel.flat[0]):
+        return None
+    return float(kernel.flat[0])
+
+
+def summed_area_table(values: np.ndarray) -> np.ndarray:
+    """
+    Build a summed-area table (integral image) with a leading row and column of zeros.
+    
+    table[r, c] holds the sum of values[:r, :c], so any rectangle sum takes four lookups.
+    """
+    rows, cols = values.shape
+    table = np.zeros((rows + 1, cols + 1), dtype=np.float64)
+    np.cumsum(np.cumsum(values, axis=0, dtype=np.float64), axis=1, out=table[1:, 1:])
+    return table
+
+
+def box_sums(table: np.ndarray, radius: int) -> np.ndarray:
+    """
+    Sum of every full (2k+1)x(2k+1) window, in O(1) per window.
+    
+    Only windows that fit inside the values are summed; border handling is done by padding
+    the values before building the table.
+    
+    Args:
+        table: Summed-area table as returned by summed_area_table()
+        radius: Kernel radius k
+        
+    Returns:
+        Array of shape (rows - 2k, cols - 2k) where element [i, j] is the sum of the window
+        centered on values[i + k, j + k]
+    """
+    size = 2 * radius + 1
+    return (table[size:, size:] - table[:-size, size:]
+            - table[size:, :-size] + table[:-size, :-size])
+
+
+def clamp_is_identity(data: np.ndarray, final_kernel: np.ndarray) -> bool:
+    """
+    Check whether clamping each term to [0, 255] can never change a product of data and kernel.
+    
+    When this holds the bounded sum is an ordinary linear filter, so faster exact
+    algorithms (separable passes, FFT) can be used in place of the per-term loop.
+    """
+    if data.size == 0 or final_kernel.size == 0:
+        return True
+    return (data.min() >= 0 and final_kernel.min() >= 0 and
+            data.max() * final_kernel.max() <= 255)
+
+
+def separable_factors(kernel, data_max: float, tolerance: float = SEPARABLE_TOLERANCE
+                      ) -> tuple[np.ndarray, np.ndarray] | None:
+    """
+    Factor a 2D kernel into a column vector and a row vector whose outer product is the kernel.
+    
+    The factorization is only accepted if the largest possible output error it introduces
+    (residual per tap × largest input value × number of taps) stays within the tolerance.
+    
+    Args:
+        kernel: 2D kernel weights
+        data_max: Largest input value the kernel will be applied to
+        tolerance: Maximum allowed absolute deviation of any output value
+        
+    Returns:
+        (column, row) vectors, or None if the kernel is not separable within tolerance
+    """
+    kernel = np.asarray(kernel, dtype=np.float64)
+    pivot_row, pivot_col = np.unravel_index(np.argmax(np.abs(kernel)), kernel.shape)
+    pivot = kernel[pivot_row, pivot_col]
+    if pivot == 0:
+        return None
+    
+    column = kernel[:, pivot_col]
+    row = kernel[pivot_row, :] / pivot
+    residual = np.abs(np.outer(column, row) - kernel).max()
+    if residual * max(data_max, 1.0) * kernel.size > tolerance / 2:
+        return None
+    return column, row
+
+
+def separable_weighted_sum(data: np.ndarray, column: np.ndarray, row: np.ndarray) -> np.ndarray:
+    """
+    Apply a separable kernel as two 1D passes (rows, then columns) over every full window.
+    
+    Costs O(k) per pixel instead of O(k²). No per-term clamping is applied, so callers
+    must check clamp_is_identity() first.
+    
+    Returns:
+        Array of shape (rows - 2k, cols - 2k), one weighted sum per window
+    """
+    row_pass = sliding_window_view(data, row.size, axis=1) @ row
+    return sliding_window_view(row_pass, column.size, axis=0) @ column
+
+
+def gaussian_weighted_sum(data: np.ndarray, kernel, constant: float) -> np.ndarray:
+    """
+    Bounded weighted sum for Gaussian kernels, using the separable fast path when it is exact.
+    
+    The separable result matches the dense per-term path within SEPARABLE_TOLERANCE.
+    Kernels that are not separable, or combinations of kernel, constant and data where
+    clamping could change a term, fall back to the dense path.
+    """
+    kernel = np.asarray(kernel, dtype=np.float64)
+    final_kernel = kernel * constant
+    radius = kernel.shape[0] // 2
+    
+    if data.size > 0 and clamp_is_identity(data, final_kernel):
+        factors = separable_factors(final_kernel, data.max())
+        if factors is not None:
+            column, row = factors
+            return separable_weighted_sum(data, column, row)
+    
+    return bounded_weighted_sum(sliding_windows(data, radius), kernel, constant)
+
+
+def bounded_summed_area_table(data: np.ndarray, final_kernel_value: float) -> np.ndarray:
+    """
+    Summed-area table of every input value times a uniform final kernel value, with each term
+    clamped to [0, 255] exactly as the per-tap loop clamps it.
+    """
+    return summed_area_table(np.clip(data * final_kernel_value, 0, 255))
+
+
+def mean_weighted_sum(data: np.ndarray, kernel, constant: float,
+                      table: np.ndarray | None = None) -> np.ndarray:
+    """
+    Bounded weighted sum for Mean kernels, answered from a summed-area table when the kernel
+    is uniform and from the per-tap path otherwise.
+    
+    Args:
+        data: 2D float input
+        kernel: (2k+1)x(2k+1) kernel weights
+        constant: Multiplier applied to every kernel weight
+        table: Table from bounded_summed_area_table() for this data and final kernel value,
+            used instead of building one (ignored for non-uniform kernels)
+    """
+    kernel = np.asarray(kernel, dtype=np.float64)
+    radius = kernel.shape[0] // 2
+    kernel_weight = uniform_kernel_weight(kernel)
+    if kernel_weight is None:
+        return bounded_weighted_sum(sliding_windows(data, radius), kernel, constant)
+    
+    if table is None:
+        table = bounded_summed_area_table(data, kernel_weight * constant)
+    return box_sums(table, radius)
+
+
+def window_median(windows: np.ndarray, max_chunk_bytes: int = MEDIAN_CHUNK_BYTES) -> np.ndarray:
+    """
+    Median of every window, averaging the two middle values for even-sized windows.
+    
+    Flattening the window view copies every window, and np.median partitions a second copy,
+    so the windows are processed in blocks of positions whose copies fit in max_chunk_bytes
+    instead of (2k+1)² values per position for the whole grid at once.
+    """
+    out_rows, out_cols = windows.shape[:2]
+    window_area = windows.shape[2] * windows.shape[3]
+    positions_per_chunk = max(1, max_chunk_bytes // (2 * window_area * windows.itemsize))
+    chunk_cols = max(1, min(out_cols, positions_per_chunk))
+    chunk_rows = max(1, positions_per_chunk // chunk_cols)
+    
+    # np.median keeps float types and returns float64 for integer windows
+    output_dtype = windows.dtype if np.issubdtype(windows.dtype, np.floating) else np.float64
+    output = np.empty((out_rows, out_cols), dtype=output_dtype)
+    for row_start in range(0, out_rows, chunk_rows):
+        for col_start in range(0, out_cols, chunk_cols):
+            chunk = windows[row_start:row_start + chunk_rows, col_start:col_start + chunk_cols]
+            output[row_start:row_start + chunk.shape[0], col_start:col_start + chunk.shape[1]] = np.median(
+                chunk.reshape(chunk.shape[0], chunk.shape[1], -1), axis=-1
+            )
+    return output
+
+
+def next_fast_length(target: int) -> int:
+    """
+    Smallest length >= target whose only prime factors are 2, 3 and 5 (fast for numpy.fft).
+    """
+    best = 1
+    while best < target:
+        best *= 2
+    power_of_five = 1
+    while power_of_five < best:
+        power_of_three = power_of_five
+        while power_of_three < best:
+            candidate = power_of_three
+            while candidate < target:
+                candidate *= 2
+            best = min(best, candidate)
+            power_of_three *= 3
+        power_of_five *= 5
+    return best
+
+
+def fft_correlate(data: np.ndarray, kernel: np.ndarray) -> np.ndarray:
+    """
+    Unbounded cross-correlation of every full window with the kernel, computed with rfft2/irfft2.
+    
+    The data is zero-padded to fast FFT sizes and multiplied by the spectrum of the
+    180° flipped kernel, which turns the FFT's native convolution into a correlation.
+    
+    Returns:
+        Array of shape (rows - kernel_rows + 1, cols - kernel_cols + 1)
+    """
+    rows, cols = data.shape
+    kernel_rows, kernel_cols = kernel.shape
+    fft_shape = (next_fast_length(rows + kernel_rows - 1), next_fast_length(cols + kernel_cols - 1))
+    
+    data_spectrum = np.fft.rfft2(data, s=fft_shape)
+    kernel_spectrum = np.fft.rfft2(kernel[::-1, ::-1], s=fft_shape)
+    full_result = np.fft.irfft2(data_spectrum * kernel_spectrum, s=fft_shape)
+    return full_result[kernel_rows - 1:rows, kernel_cols - 1:cols]
+
+
+def fft_bounded_weighted_sum(data: np.ndarray, final_kernel: np.ndarray) -> np.ndarray | None:
+    """
+    FFT version of bounded_weighted_sum() for non-negative data.
+    
+    Clamping a term input × weight to [0, 255] depends only on the weight:
+    - weights <= 0 always give 0 and are dropped
+    - weights small enough that no input can exceed 255 are linear and share one correlation
+    - every other distinct weight w gets its own correlation of min(input × w, 255) with
+      the mask of taps holding w
+    
+    Returns:
+        Array of bounded sums, one per full window, or None if the data is negative or
+        more than FFT_MAX_CLAMPED_WEIGHTS distinct weights need clamping
+    """
+    if data.size == 0 or data.min() < 0:
+        return None
+    
+    data_max = data.max()
+    linear_taps = (final_kernel > 0) & (final_kernel * data_max <= 255)
+    clamped_weights = np.unique(final_kernel[(final_kernel > 0) & ~linear_taps])
+    if clamped_weights.size > FFT_MAX_CLAMPED_WEIGHTS:
+        return None
+    
+    total_sums = fft_correlate(data, np.where(linear_taps, final_kernel, 0.0))
+    for weight in clamped_weights:
+        bounded_terms = np.minimum(data * weight, 255)
+        total_sums += fft_correlate(bounded_terms, (final_kernel == weight).astype(np.float64))
+    
+    # Every term is non-negative; drop the tiny negative values left by FFT round-off
+    return np.maximum(total_sums, 0)
+
+
+def custom_weighted_sum(data: np.ndarray, kernel, constant: float, filter_type: str) -> np.ndarray:
+    """
+    Bounded weighted sum for custom kernels, switching to the FFT backend for large kernels.
+    
+    Convolution mirrors each window through its center and uses the 180° flipped kernel
+    (as CustomFilterCalculator._calculate_convolution() does). The two flips cancel, so
+    the FFT backend correlates the data with the kernel as stored for both filter types.
+    
+    Kernels of FFT_KERNEL_SIZE_THRESHOLD or more taps per side use the FFT backend, except
+    that the direct sliding-window path is used instead when:
+    - the data has negative values, or
+    - more than FFT_MAX_CLAMPED_WEIGHTS distinct positive weights can push a term past 255
+      (weight × constant × data max > 255), e.g. most random-weight kernels on bright images
+    """
+    kernel = np.asarray(kernel, dtype=np.float64)
+    radius = kernel.shape[0] // 2
+    
+    if kernel.shape[0] >= FFT_KERNEL_SIZE_THRESHOLD:
+        total_sums = fft_bounded_weighted_sum(data, kernel * constant)
+        if total_sums is not None:
+            return total_sums
+    
+    windows = sliding_windows(data, radius)
+    if filter_type == "Convolution":
+        return bounded_weighted_sum(windows[..., ::-1, ::-1], kernel[::-1, ::-1], constant)
+    return bounded_weighted_sum(windows, kernel, constant)
+
+
+def is_8bit(data: np.ndarray) -> bool:
+    """
+    Check whether every value is an integer in [0, 255], so it can be binned into a 256-bin histogram.
+    """
+    if data.size == 0:
+        return False
+    if np.issubdtype(data.dtype, np.integer):
+        return data.min() >= 0 and data.max() <= 255
+    return bool(np.all((data >= 0) & (data <= 255) & (data == np.floor(data))))
+
+
+def histogram_median(data: np.ndarray, radius: int) -> np.ndarray:
+    """
+    Median of every full (2k+1)x(2k+1) window of 8-bit data using sliding 256-bin histograms.
+    
+    Follows Perreault and Hébert: one histogram is kept per input column and updated by
+    adding the row entering the window and removing the row leaving it. The window
+    histograms for a whole output row are then the sums of 2k+1 adjacent column
+    histograms, taken from a prefix sum across columns. Both steps cost O(256) per
+    pixel regardless of the kernel radius.
+    
+    Output columns are computed in blocks of HISTOGRAM_MEDIAN_BLOCK_COLS (each reading a
+    2k-column halo), so the per-column histograms stay in cache and their memory does not
+    grow with the image width.
+    
+    Args:
+        data: 2D array of integer values in [0, 255]
+        radius: Kernel radius k
+        
+    Returns:
+        Array of shape (rows - 2k, cols - 2k) with the median of each window
+    """
+    values = data.astype(np.intp)
+    size = 2 * radius + 1
+    out_cols = values.shape[1] - size + 1
+    output = np.empty((max(0, values.shape[0] - size + 1), max(0, out_cols)))
+    for block_start in range(0, out_cols, HISTOGRAM_MEDIAN_BLOCK_COLS):
+        block_stop = min(block_start + HISTOGRAM_MEDIAN_BLOCK_COLS, out_cols)
+        output[:, block_start:block_stop] = _histogram_median_block(values[:, block_start:block_stop + size - 1], radius)
+    return output
+
+
+def _histogram_median_block(values: np.ndarray, radius: int) -> np.ndarray:
+    # histogram_median() for one block of columns of intp values
+    rows, cols = values.shape
+    size = 2 * radius + 1
+    out_rows, out_cols = rows - size + 1, cols - size + 1
+    # Window sizes are always odd, so the median is the value with this rank
+    median_rank = (size * size) // 2
+    
+    column_indices = np.arange(cols)
+    column_histograms = np.zeros((cols, 256), dtype=np.int32)
+    for row in range(size):
+        column_histograms[column_indices, values[row]] += 1
+    
+    prefix = np.zeros((cols + 1, 256), dtype=np.int32)
+    output = np.empty((out_rows, out_cols))
+    
+    for out_row in range(out_rows):
+        if out_row > 0:
+            # Slide every column histogram down by one row
+            column_histograms[column_indices, values[out_row - 1]] -= 1
+            column_histograms[column_indices, values[out_row + size - 1]] += 1
+        
+        np.cumsum(column_histograms, axis=0, out=prefix[1:])
+        window_histograms = prefix[size:] - prefix[:out_cols]
+        
+        # The median is the first bin whose cumulative count passes the median rank
+        cumulative_counts = np.cumsum(window_histograms, axis=1)
+        output[out_row] = np.argmax(cumulative_counts > median_rank, axis=1)
+    
+    return output
+
+
+def median_filter(data: np.ndarray, radius: int) -> np.ndarray:
+    """
+    Median of every full window, using histogram_median() for 8-bit data once the kernel
+    is large enough for the sliding histogram to beat sorting each window.
+    """
+    min_radius = HISTOGRAM_MEDIAN_MIN_RADIUS_FLOAT if np.issubdtype(data.dtype, np.floating) else HISTOGRAM_MEDIAN_MIN_RADIUS
+    if radius >= min_radius and is_8bit(data):
+        return histogram_median(data, radius)
+    return window_median(sliding_windows(data, radius))
+
+
+def embed_valid_output(valid_output: np.ndarray, shape: tuple[int, int], radius: int) -> np.ndarray:
+    """
+    Place the results for full-window positions into an output grid of the given shape.
+    
+    Cells the kernel can never be centered on (closer than k to an edge) are set to NaN,
+    mirroring the None cells of the output image model.
+    """
+    output = np.full(shape, np.nan)
+    rows, cols = valid_output.shape
+    output[radius:radius + rows, radius:radius + cols] = valid_output
+    return output
+
+
+def output_extent(radius: int, output_shape: str) -> int:
+    """
+    Return how many cells the output grows (or shrinks, if negative) on each side of the input.
+    
+    "same" keeps the input size, "valid" keeps only positions whose window fits inside the
+    input (N - 2k) and "full" covers every position where the kernel overlaps the input (N + 2k).
+    """
+    if output_shape == "valid":
+        return -radius
+    if output_shape == "full":
+        return radius
+    return 0
+
+
+def border_index(index: int, length: int, border_mode: str) -> int | None:
+    """
+    Map a possibly out-of-range index along one axis to the index the border mode reads.
+    
+    Args:
+        index: Index along the axis, may be negative or >= length
+        length: Size of the axis
+        border_mode: "Zero", "Replicate", "Reflect" (mirrored without repeating the edge cell)
+            or "Wrap"
+    
+    Returns:
+        Source index, or None where the border mode reads zero
+    """
+    if 0 <= index < length:
+        return index
+    if border_mode == "Replicate":
+        return min(max(index, 0), length - 1)
+    if border_mode == "Wrap":
+        return index % length
+    if border_mode == "Reflect":
+        if length == 1:
+            return 0
+        period = 2 * (length - 1)
+        folded = index % period
+        return period - folded if folded >= length else folded
+    return None
+
+
+def border_indices(indices: np.ndarray, length: int, border_mode: str) -> np.ndarray:
+    """
+    Vectorized form of border_index(); positions that read zero are marked with -1.
+    """
+    indices = np.asarray(indices)
+    if border_mode == "Replicate":
+        return np.clip(indices, 0, length - 1)
+    if border_mode == "Wrap":
+        return indices % length
+    if border_mode == "Reflect":
+        if length == 1:
+            return np.zeros_like(indices)
+        period = 2 * (length - 1)
+        folded = indices % period
+        return np.where(folded >= length, period - folded, folded)
+    return np.where((indices >= 0) & (indices < length), indices, -1)
+
+
+def gather_with_border(data: np.ndarray, row_sources: np.ndarray, col_sources: np.ndarray) -> np.ndarray:
+    """
+    Read data at the outer product of row and column source indices from border_indices().
+    
+    Cells whose row or column source is -1 read as zero.
+    """
+    # Fancy indexing already returns a copy, so the zero cells can be written in place
+    values = data[np.ix_(np.maximum(row_sources, 0), np.maximum(col_sources, 0))]
+    outside = (row_sources < 0)[:, np.newaxis] | (col_sources < 0)[np.newaxis, :]
+    values[outside] = 0
+    return values
+
+
+class PaddedBuffer:
+    """
+    Reusable buffer holding an input grid padded according to a border mode.
+    
+    The buffer and its index maps are allocated once per (shape, padding, border mode). Later
+    calls only copy the interior and refill the border strips, so repeated whole-image passes
+    do not reallocate, and the window kernels downstream read the padded data without any
+    bounds checks. The returned array is overwritten by the next call to pad().
+    """
+    def __init__(self):
+        self._key = None
+        self._buffer = None
+        self._row_sources = None
+        self._col_sources = None
+    
+    def pad(self, data: np.ndarray, padding: int, border_mode: str) -> np.ndarray:
+        """
+        Pad data by the given number of cells on every side.
+        
+        Args:
+            data: 2D float input
+            padding: Cells added on each side
+            border_mode: "Zero", "Replicate", "Reflect" or "Wrap"
+        
+        Returns:
+            Array of shape (rows + 2 * padding, cols + 2 * padding)
+        """
+        if padding == 0:
+            return data
+        
+        rows, cols = data.shape
+        key = (rows, cols, padding, border_mode)
+        if key != self._key:
+            self._buffer = np.empty((rows + 2 * padding, cols + 2 * padding))
+            self._row_sources = border_indices(np.arange(-padding, rows + padding), rows, border_mode)
+            self._col_sources = border_indices(np.arange(-padding, cols + padding), cols, border_mode)
+            self._key = key
+        
+        buffer = self._buffer
+        buffer[padding:padding + rows, padding:padding + cols] = data
+        # Top and bottom strips span the full width; left and right strips cover the interior rows
+        strips = (
+            (slice(0, padding), slice(None)),
+            (slice(padding + rows, None), slice(None)),
+            (slice(padding, padding + rows), slice(0, padding)),
+            (slice(padding, padding + rows), slice(padding + cols, None)),
+        )
+        for strip_rows, strip_cols in strips:
+            buffer[strip_rows, strip_cols] = gather_with_border(
+                data, self._row_sources[strip_rows], self._col_sources[strip_cols]
+            )
+        return buffer
+
+
+def filter_valid_output(data: np.ndarray, filter_name: str, kernel, constant: float,
+                        filter_type: str = "Cross-Correlation") -> np.ndarray:
+    """
+    Apply one of the playground filters at every position whose window fits inside data.
+    
+    This is the model-free equivalent of the calculators' _apply_valid(), for headless use.
+    
+    Args:
+        data: 2D float input (already padded if border handling is wanted)
+        filter_name: "Mean", "Gaussian", "Custom" or "Median"
+        kernel: (2k+1)x(2k+1) kernel weights (only the size is used by Median)
+        constant: Multiplier applied to every kernel weight
+        filter_type: "Cross-Correlation" or "Convolution" (only used by Custom)
+    
+    Returns:
+        Array of shape (rows - 2k, cols - 2k)
+    """
+    kernel = np.asarray(kernel, dtype=np.float64)
+    radius = kernel.shape[0] // 2
+    if filter_name == "Mean":
+        return mean_weighted_sum(data, kernel, constant) / kernel.size
+    if filter_name == "Gaussian":
+        return gaussian_weighted_sum(data, kernel, constant)
+    if filter_name == "Custom":
+        return custom_weighted_sum(data, kernel, constant, filter_type)
+    if filter_name == "Median":
+        return median_filter(data, radius)
+    raise ValueError(f"Unknown filter: {filter_name}")
@@ -1,4 +1,7 @@
+from functools import lru_cache
 from typing import TypeVar
+import numpy as np
+from consts import GAUSSIAN_KERNEL_CACHE_SIZE
 
 T = TypeVar('T', int, float)
 
@@ -14,3 +17,33 @@ def flip_kernel_180(kernel_data: list[list[T]]) -> list[list[T]]:
     return [[kernel_data[size - 1 - row][size - 1 - col] 
              for col in range(size)] 
             for row in range(size)]
+
+
+@lru_cache(maxsize=GAUSSIAN_KERNEL_CACHE_SIZE)
+def gaussian_kernel(size: int, sigma: float, normalize: bool) -> np.ndarray:
+    """
+    Build a size x size Gaussian kernel G = 1/(2*pi*sigma^2) * exp(-(x^2+y^2)/(2*sigma^2)).
+    
+    Kernels are computed in one vectorized pass and memoized per (size, sigma, normalize),
+    so revisiting a sigma value costs nothing. The returned array is shared between callers
+    and therefore read-only.
+    
+    Args:
+        size: Kernel width (2k+1)
+        sigma: Standard deviation of the Gaussian
+        normalize: Scale the weights so they sum to 1
+    
+    Returns:
+        Read-only (size, size) float64 array of kernel weights
+    """
+    offsets = np.arange(size) - size // 2
+    squared_distances = offsets[:, np.newaxis] ** 2 + offsets[np.newaxis, :] ** 2
+    sigma_squared = sigma * sigma
+    kernel = np.exp(-squared_distances / (2.0 * sigma_squared)) / (2.0 * np.pi * sigma_squared)
+    
+    kernel_sum = kernel.sum()
+    if normalize and kernel_sum > 0:
+        kernel = kernel / kernel_sum
+    
+    kernel.flags.writeable = False
+    return kernel
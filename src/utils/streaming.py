@@ -0,0 +1,211 @@
+import os
+import numpy as np
+from consts import (
+    DEFAULT_OUTPUT_SHAPE, STREAM_MAX_BAND_BYTES, STREAM_WORKING_COPIES, STREAM_FFT_SCRATCH_COPIES,
+    MEDIAN_CHUNK_BYTES, FFT_KERNEL_SIZE_THRESHOLD
+)
+from utils.filter_engine import (
+    to_float_array, output_extent, border_indices, gather_with_border, filter_valid_output, next_fast_length
+)
+
+
+def open_image(path: str, shape: tuple[int, int] | None = None, dtype=np.uint8) -> np.ndarray:
+    """
+    Memory-map a 2D grayscale image without reading it into RAM.
+    
+    Args:
+        path: A .npy file, or a headerless raw file of row-major pixels
+        shape: (rows, cols) of a raw file; ignored for .npy files
+        dtype: Pixel type of a raw file; ignored for .npy files
+    
+    Returns:
+        Read-only memory-mapped array of shape (rows, cols)
+    """
+    if os.path.splitext(path)[1].lower() == ".npy":
+        data = np.load(path, mmap_mode="r")
+    else:
+        if shape is None:
+            raise ValueError(f"Raw image {path} needs an explicit (rows, cols) shape")
+        data = np.memmap(path, dtype=dtype, mode="r", shape=tuple(shape))
+    
+    if data.ndim != 2:
+        raise ValueError(f"Expected a 2D grayscale image, got shape {data.shape}")
+    return data
+
+
+def band_rows_for(cols: int, radius: int, filter_name: str,
+                  max_band_bytes: int = STREAM_MAX_BAND_BYTES) -> int:
+    """
+    Choose how many output rows to compute per band so the working set stays under max_band_bytes.
+    
+    Each band holds its rows plus a 2k-row halo as float64, and the filters keep a few
+    temporaries of the same size (STREAM_WORKING_COPIES). Median also needs scratch that
+    does not shrink with the band: sorted window copies are bounded by MEDIAN_CHUNK_BYTES
+    (see window_median()) and the histograms of histogram_median() by its column blocks,
+    so that much of the budget is set aside first.
+    
+    Custom kernels of FFT_KERNEL_SIZE_THRESHOLD or more taps per side run through
+    fft_correlate(), whose complex spectra cover the band zero-padded to fast FFT sizes, so
+    the band is shrunk until those buffers fit as well (see fft_band_bytes()).
+    
+    At least one row is always returned, so a budget smaller than a single row's working
+    set is exceeded.
+    """
+    if filter_name == "Median":
+        max_band_bytes = max(0, max_band_bytes - MEDIAN_CHUNK_BYTES)
+    bytes_per_row = max(1, cols) * 8 * STREAM_WORKING_COPIES
+    band_rows = max(1, max_band_bytes // bytes_per_row - 2 * radius)
+    if not uses_fft(filter_name, radius):
+        return band_rows
+    return _largest_fitting(band_rows, lambda rows: fft_band_bytes(rows, cols, radius) <= max_band_bytes)
+
+
+def band_cols_for(cols: int, radius: int, filter_name: str,
+                  max_band_bytes: int = STREAM_MAX_BAND_BYTES) -> int:
+    """
+    Choose how many output columns each band covers, given cols input columns (halo included).
+    
+    Bands span the whole width, except on the FFT path: a band only a few rows tall wastes
+    most of its transform on the 4k rows of halo and padding, so wide images are split into
+    tiles about as tall as they are wide that still fit max_band_bytes.
+    """
+    computed_cols = max(1, cols - 2 * radius)
+    if not uses_fft(filter_name, radius):
+        return computed_cols
+    return _largest_fitting(
+        computed_cols, lambda side: fft_band_bytes(side, side + 2 * radius, radius) <= max_band_bytes
+    )
+
+
+def uses_fft(filter_name: str, radius: int) -> bool:
+    """
+    Whether filter_valid_output() runs this filter through the FFT backend (see custom_weighted_sum()).
+    """
+    return filter_name == "Custom" and 2 * radius + 1 >= FFT_KERNEL_SIZE_THRESHOLD
+
+
+def fft_band_bytes(band_rows: int, cols: int, radius: int) -> int:
+    """
+    Working set of a band of band_rows output rows and cols input columns on the FFT path.
+    
+    On top of the STREAM_WORKING_COPIES band-sized arrays, each fft_correlate() call holds
+    complex spectra of the band zero-padded to fast FFT sizes in both directions
+    (STREAM_FFT_SCRATCH_COPIES float64s per padded cell).
+    """
+    kernel_size = 2 * radius + 1
+    input_rows = band_rows + 2 * radius
+    fft_cells = next_fast_length(input_rows + kernel_size - 1) * next_fast_length(cols + kernel_size - 1)
+    return (input_rows * cols * STREAM_WORKING_COPIES + fft_cells * STREAM_FFT_SCRATCH_COPIES) * 8
+
+
+def _largest_fitting(limit: int, fits) -> int:
+    # Largest value in [1, limit] passing fits, which must be monotone (1 when none does)
+    low, high = 1, max(1, limit)
+    while low < high:
+        middle = (low + high + 1) // 2
+        if fits(middle):
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+def to_output_dtype(values: np.ndarray, dtype) -> np.ndarray:
+    """
+    Convert filter results to the output dtype.
+    
+    Integer outputs are rounded and clamped to [0, 255] like the output image cells, with
+    NaN (no value) written as 0. Float outputs are stored unchanged.
+    """
+    if np.issubdtype(np.dtype(dtype), np.integer):
+        return np.clip(np.rint(np.nan_to_num(values, nan=0.0)), 0, 255).astype(dtype)
+    return values.astype(dtype)
+
+
+def stream_filter(source: np.ndarray, output_path: str | None, filter_name: str, kernel,
+                  constant: float = 1.0, filter_type: str = "Cross-Correlation",
+                  border_mode: str = "Replicate", output_shape: str = DEFAULT_OUTPUT_SHAPE,
+                  band_rows: int | None = None, output_dtype=np.uint8) -> np.ndarray:
+    """
+    Filter an image band by band and stream the result to a .npy memmap (or an in-memory array).
+    
+    Each band reads its rows plus a k-row halo on either side from the source (borders are
+    supplied through the border mode), runs the same vectorized filter as the playground,
+    and writes its rows to the output file. Large custom kernels (FFT backend) also split
+    each band into column tiles with a k-column halo. Peak memory depends on the band size,
+    not on the image size.
+    
+    Args:
+        source: 2D array or memmap (see open_image())
+        output_path: Destination .npy file, created or overwritten; None returns an
+            in-memory array instead
+        filter_name: "Mean", "Gaussian", "Custom" or "Median"
+        kernel: (2k+1)x(2k+1) kernel weights
+        constant: Multiplier applied to every kernel weight
+        filter_type: "Cross-Correlation" or "Convolution" (only used by Custom)
+        border_mode: "Valid Only", "Zero", "Replicate", "Reflect" or "Wrap"
+        output_shape: "same", "valid" or "full"
+        band_rows: Output rows per band; chosen from STREAM_MAX_BAND_BYTES when None
+        output_dtype: uint8 (rounded and clamped like the output image) or a float type
+    
+    Returns:
+        The output memmap, flushed to disk, or the in-memory output array
+    
+    Raises:
+        ValueError: If band_rows is less than 1
+    """
+    if band_rows is not None and band_rows < 1:
+        raise ValueError(f"band_rows must be at least 1, got {band_rows}")
+    kernel = np.asarray(kernel, dtype=np.float64)
+    radius = kernel.shape[0] // 2
+    rows, cols = source.shape
+    
+    extent = output_extent(radius, output_shape)
+    shape = (max(0, rows + 2 * extent), max(0, cols + 2 * extent))
+    if output_path is None:
+        output = np.empty(shape, dtype=output_dtype)
+    else:
+        output = np.lib.format.open_memmap(output_path, mode="w+", dtype=output_dtype, shape=shape)
+    
+    # "Valid Only" computes the full-window positions and leaves every other cell without a value
+    if border_mode == "Valid Only":
+        padding = 0
+        offset = radius + extent
+        output[:] = to_output_dtype(np.array(np.nan), output_dtype)
+    else:
+        padding = radius + extent
+        offset = 0
+    
+    # Index maps from padded coordinates to source rows/columns (-1 reads zero)
+    row_sources = border_indices(np.arange(-padding, rows + padding), rows, border_mode)
+    col_sources = border_indices(np.arange(-padding, cols + padding), cols, border_mode)
+    computed_rows = rows + 2 * padding - 2 * radius
+    computed_cols = cols + 2 * padding - 2 * radius
+    if computed_rows <= 0 or computed_cols <= 0:
+        return _finish(output)
+    
+    band_cols = band_cols_for(len(col_sources), radius, filter_name)
+    if band_rows is None:
+        band_rows = band_rows_for(band_cols + 2 * radius, radius, filter_name)
+    
+    for band_start in range(0, computed_rows, band_rows):
+        band_stop = min(band_start + band_rows, computed_rows)
+        band_row_sources = row_sources[band_start:band_stop + 2 * radius]
+        for tile_start in range(0, computed_cols, band_cols):
+            tile_stop = min(tile_start + band_cols, computed_cols)
+            band = to_float_array(
+                gather_with_border(source, band_row_sources, col_sources[tile_start:tile_stop + 2 * radius])
+            )
+            band_output = filter_valid_output(band, filter_name, kernel, constant, filter_type)
+            output[offset + band_start:offset + band_stop, offset + tile_start:offset + tile_stop] = (
+                to_output_dtype(band_output, output_dtype)
+            )
+    
+    return _finish(output)
+
+
+def _finish(output: np.ndarray) -> np.ndarray:
+    # Make sure memory-mapped results reach the disk before the caller reads the file
+    if isinstance(output, np.memmap):
+        output.flush()
+    return output
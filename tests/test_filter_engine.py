@@ -0,0 +1,75 @@
+import unittest
+import numpy as np
+from consts import FFT_KERNEL_SIZE_THRESHOLD, FFT_MAX_CLAMPED_WEIGHTS
+from utils.filter_engine import (
+    sliding_windows, bounded_weighted_sum, fft_bounded_weighted_sum, custom_weighted_sum
+)
+
+# Weights spanning every clamping case: dropped (<= 0), linear and clamped at inputs up to 255
+WEIGHT_CHOICES = [-1.0, 0.0, 0.004, 0.01, 0.5, 2.0, 3.0]
+
+
+def direct_weighted_sum(data: np.ndarray, kernel: np.ndarray, constant: float, filter_type: str) -> np.ndarray:
+    windows = sliding_windows(data, kernel.shape[0] // 2)
+    if filter_type == "Convolution":
+        return bounded_weighted_sum(windows[..., ::-1, ::-1], kernel[::-1, ::-1], constant)
+    return bounded_weighted_sum(windows, kernel, constant)
+
+
+class FftBoundedWeightedSumTest(unittest.TestCase):
+    """
+    The FFT backend must match the direct bounded_weighted_sum() path for custom kernels.
+    """
+    def setUp(self):
+        self.rng = np.random.default_rng(0)
+    
+    def make_inputs(self):
+        yield "8-bit", self.rng.integers(0, 256, (64, 80)).astype(np.float64)
+        yield "float", self.rng.random((64, 80)) * 4
+    
+    def test_matches_direct_path(self):
+        for kernel_size in (FFT_KERNEL_SIZE_THRESHOLD, 21, 31):
+            kernel = self.rng.choice(WEIGHT_CHOICES, (kernel_size, kernel_size))
+            for name, data in self.make_inputs():
+                for filter_type in ("Cross-Correlation", "Convolution"):
+                    with self.subTest(kernel_size=kernel_size, data=name, filter_type=filter_type):
+                        expected = direct_weighted_sum(data, kernel, 1.0, filter_type)
+                        self.assertIsNotNone(fft_bounded_weighted_sum(data, kernel))
+                        np.testing.assert_allclose(
+                            custom_weighted_sum(data, kernel, 1.0, filter_type), expected, rtol=0, atol=1e-9
+                        )
+    
+    def test_asymmetric_kernel_with_constant(self):
+        # Convolution and correlation only agree for symmetric kernels, so this catches a wrong flip
+        kernel = np.zeros((FFT_KERNEL_SIZE_THRESHOLD, FFT_KERNEL_SIZE_THRESHOLD))
+        kernel[0, :3] = [1.0, 2.0, 0.25]
+        kernel[-1, -1] = 0.5
+        data = self.rng.integers(0, 256, (40, 50)).astype(np.float64)
+        for filter_type in ("Cross-Correlation", "Convolution"):
+            with self.subTest(filter_type=filter_type):
+                np.testing.assert_allclose(
+                    custom_weighted_sum(data, kernel, 0.5, filter_type),
+                    direct_weighted_sum(data, kernel, 0.5, filter_type), rtol=0, atol=1e-9
+                )
+    
+    def test_falls_back_to_direct_path(self):
+        size = FFT_KERNEL_SIZE_THRESHOLD
+        data = self.rng.integers(0, 256, (40, 50)).astype(np.float64)
+        many_weights = np.arange(1, size * size + 1, dtype=np.float64).reshape(size, size)
+        self.assertGreater(np.unique(many_weights).size, FFT_MAX_CLAMPED_WEIGHTS)
+        negative_data = data - 128
+        uniform_kernel = np.ones((size, size))
+        
+        for name, case_data, kernel in (("many clamped weights", data, many_weights),
+                                        ("negative data", negative_data, uniform_kernel)):
+            with self.subTest(case=name):
+                self.assertIsNone(fft_bounded_weighted_sum(case_data, kernel))
+                for filter_type in ("Cross-Correlation", "Convolution"):
+                    np.testing.assert_array_equal(
+                        custom_weighted_sum(case_data, kernel, 1.0, filter_type),
+                        direct_weighted_sum(case_data, kernel, 1.0, filter_type)
+                    )
+
+
+if __name__ == "__main__":
+    unittest.main()